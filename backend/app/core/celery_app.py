@@ -26,6 +26,20 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
+    # Teaser generation runs seconds to minutes; default prefetch would pile
+    # several onto one process while its siblings idle. One-at-a-time
+    # reservation plus late acks keeps the pool balanced and re-queues a task
+    # if its worker dies mid-run.
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    # Pipeline stages route to their own queues so worker pools can be sized
+    # per stage (io = high concurrency, cpu = low, net = medium)
+    task_routes={
+        "app.tasks.parse_project": {"queue": "io"},
+        "app.tasks.enrich_project": {"queue": "io"},
+        "app.tasks.generate_assets": {"queue": "cpu"},
+        "app.tasks.upload_artifacts": {"queue": "net"},
+    },
 )
 
 # Optional: automatically discover tasks in certain modules
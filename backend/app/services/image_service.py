@@ -6,10 +6,18 @@ Uses Pexels (free, no key required for basic) and Unsplash fallbacks
 import os
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, List, Dict
 from bs4 import BeautifulSoup
 import urllib.parse
 
+# Shared pooled session: repeat hits to the same image host reuse the connection
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=Retry(total=2, backoff_factor=0.3))
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+
 
 class ImageService:
     """Service for sourcing high-quality images for presentations"""
@@ -30,31 +38,36 @@ class ImageService:
         "General Business": ["professional business", "corporate office", "business meeting"]
     }
 
+    # Resolved URLs per (sector, variation); the same sector recurring across
+    # projects costs zero HTTP calls after the first. Misses are not cached so
+    # a transient outage doesn't stick for the worker's lifetime.
+    _url_cache: Dict[tuple, str] = {}
+
     @staticmethod
     def get_sector_image(sector: str, variation: int = 0) -> Optional[str]:
         """Get a relevant image URL for the sector"""
+        cache_key = (sector, variation)
+        cached = ImageService._url_cache.get(cache_key)
+        if cached:
+            return cached
+
         search_terms = ImageService.SECTOR_IMAGES.get(
-            sector, 
+            sector,
             ImageService.SECTOR_IMAGES["General Business"]
         )
-        
+
         # Cycle through variations
         term = search_terms[variation % len(search_terms)]
-        
+
         # Try multiple sources
-        url = ImageService._get_pexels_image(term)
-        if url:
-            return url
-        
-        url = ImageService._get_unsplash_direct(term)
-        if url:
-            return url
-        
-        url = ImageService._get_picsum_image()
+        url = (
+            ImageService._get_pexels_image(term)
+            or ImageService._get_unsplash_direct(term)
+            or ImageService._get_picsum_image()
+        )
         if url:
-            return url
-        
-        return None
+            ImageService._url_cache[cache_key] = url
+        return url
 
     @staticmethod
     def _get_pexels_image(query: str) -> Optional[str]:
@@ -66,7 +79,7 @@ class ImageService:
         try:
             headers = {"Authorization": api_key}
             params = {"query": query, "per_page": 1, "orientation": "landscape"}
-            response = requests.get(
+            response = _SESSION.get(
                 "https://api.pexels.com/v1/search",
                 headers=headers,
                 params=params,
@@ -91,7 +104,7 @@ class ImageService:
             encoded_query = urllib.parse.quote(query)
             source_url = f"https://source.unsplash.com/1280x720/?{encoded_query}"
             
-            response = requests.get(source_url, timeout=10, allow_redirects=True)
+            response = _SESSION.get(source_url, timeout=10, allow_redirects=True)
             if response.status_code == 200:
                 return response.url  # Returns the redirected image URL
         except Exception as e:
@@ -111,7 +124,7 @@ class ImageService:
     def download_image(url: str, save_path: str) -> bool:
         """Download image to local path"""
         try:
-            response = requests.get(url, timeout=15)
+            response = _SESSION.get(url, timeout=15)
             if response.status_code == 200:
                 with open(save_path, 'wb') as f:
                     f.write(response.content)
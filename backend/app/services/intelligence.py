@@ -3,6 +3,7 @@ Intelligence Service - Enhanced Narrative Generation for Sample Output Style
 Generates comprehensive data for PPT including customers, assets, certifications, investment highlights
 """
 
+import hashlib
 import os
 import re
 import json
@@ -18,10 +19,28 @@ try:
 except ImportError:
     OpenAI = None
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _cagr_impl(start: float, end: float, n: int) -> float:
+    return ((end / start) ** (1.0 / n) - 1.0) * 100.0
+
+
+if njit is not None:
+    # cache=True persists the compiled kernel, so the compile cost is paid
+    # once per install rather than once per worker start
+    _cagr_impl = njit(cache=True)(_cagr_impl)
+
 
 class IntelligenceService:
     """Generates rich narrative data for investment teasers"""
-    
+
+    # detect_sector results keyed by (len, head-hash) of the input text
+    _sector_cache: Dict[tuple, str] = {}
+
     SECTORS = {
         "Pharma / Healthcare": {
             "keywords": ["pharma", "pharmaceutical", "drug", "api", "hospital", "clinical", 
@@ -81,6 +100,12 @@ class IntelligenceService:
     def detect_sector(text: str) -> str:
         if not text:
             return "General Business"
+        # Retries and re-runs feed identical text back in; key on length plus
+        # a head hash so the keyword sweep over multi-MB input is paid once
+        cache_key = (len(text), hashlib.md5(text[:4096].encode("utf-8", "ignore")).hexdigest())
+        cached = IntelligenceService._sector_cache.get(cache_key)
+        if cached:
+            return cached
         t = text.lower()
         scores = {}
         for sector, config in IntelligenceService.SECTORS.items():
@@ -89,7 +114,10 @@ class IntelligenceService:
             score = sum(1 for k in config["keywords"] if k in t)
             if score > 0:
                 scores[sector] = score
-        return max(scores, key=scores.get) if scores else "General Business"
+        result = max(scores, key=scores.get) if scores else "General Business"
+        if len(IntelligenceService._sector_cache) < 1024:
+            IntelligenceService._sector_cache[cache_key] = result
+        return result
 
     @staticmethod
     def generate_narrative(sector: str, financial_data: Dict, kpis: Dict = None, scraped_text: str = None) -> Dict:
@@ -275,7 +303,7 @@ INSTRUCTIONS:
             start, end = float(series[0]), float(series[-1])
             if start <= 0 or end <= 0: return 15
             n = len(series) - 1
-            return int(round(((end / start) ** (1 / n) - 1) * 100))
+            return int(round(_cagr_impl(start, end, n)))
         except: return 15
 
     @staticmethod
@@ -0,0 +1,77 @@
+"""
+Narrative Cache - persistent exact-match cache for AI narrative calls
+Keyed by sector + input hashes so re-runs of the same project (or one with
+identical inputs) skip the LLM round trip entirely
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+_DB_PATH = os.path.join("data", "narrative_cache.db")
+# Entries expire so a narrative generated while both LLM providers were down
+# (the canned sector-template fallback) doesn't get pinned forever
+_TTL_SECONDS = 7 * 86400
+_lock = threading.Lock()
+_conn = None
+
+
+def _get_conn():
+    global _conn
+    if _conn is None:
+        os.makedirs(os.path.dirname(_DB_PATH), exist_ok=True)
+        _conn = sqlite3.connect(_DB_PATH, check_same_thread=False)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS narratives ("
+            "key TEXT PRIMARY KEY, "
+            "payload TEXT NOT NULL, "
+            "created_at REAL DEFAULT (strftime('%s','now')))"
+        )
+        _conn.commit()
+    return _conn
+
+
+def make_key(sector: str, scraped_text: Optional[str], financial_data: Dict[str, Any], kpis: Dict[str, Any]) -> str:
+    """Build the cache key from everything generate_narrative actually sees"""
+    h = hashlib.sha256()
+    h.update((sector or "").encode())
+    h.update((scraped_text or "")[:12000].encode("utf-8", "ignore"))
+    # Hash the full values, not just the key sets: the prompt embeds both
+    # dicts verbatim, so two projects with the same shape but different
+    # numbers must not share a narrative
+    h.update(json.dumps(financial_data or {}, sort_keys=True, default=str).encode())
+    h.update(json.dumps(kpis or {}, sort_keys=True, default=str).encode())
+    return h.hexdigest()
+
+
+def get(key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached narrative for key, or None if absent or expired"""
+    try:
+        with _lock:
+            row = _get_conn().execute(
+                "SELECT payload FROM narratives WHERE key = ? AND created_at > ?",
+                (key, time.time() - _TTL_SECONDS)
+            ).fetchone()
+        if row:
+            return json.loads(row[0])
+    except Exception as e:
+        print(f"[NarrativeCache] Read error: {e}")
+    return None
+
+
+def put(key: str, narrative: Dict[str, Any]):
+    """Store a generated narrative under key"""
+    try:
+        with _lock:
+            conn = _get_conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO narratives (key, payload) VALUES (?, ?)",
+                (key, json.dumps(narrative))
+            )
+            conn.commit()
+    except Exception as e:
+        print(f"[NarrativeCache] Write error: {e}")
@@ -5,9 +5,12 @@ Robust extraction of financial data and KPIs from Excel and PDF files
 
 import pandas as pd
 import fitz  # PyMuPDF
+import hashlib
+import json
+import os
 import re
 from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, is_dataclass
 from datetime import datetime
 
 try:
@@ -16,6 +19,53 @@ except ImportError:
     camelot = None
 
 
+# Content-hash cache for parse/extraction output: the same pitch deck gets
+# re-uploaded across projects constantly, and a cache hit skips the full
+# PyMuPDF/Camelot pass (or the regex extraction sweep) entirely
+_PARSE_CACHE_DIR = os.path.join("data", "parse_cache")
+
+
+def _content_digest(data: bytes) -> str:
+    # blake2b is the fastest hash in the stdlib; 16 bytes is plenty of key space
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _parse_cache_get(kind: str, digest: str) -> Optional[Dict[str, Any]]:
+    try:
+        path = os.path.join(_PARSE_CACHE_DIR, f"{kind}-{digest}.json")
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"[ParseCache] Read error: {e}")
+        return None
+
+
+def _cache_json_default(obj):
+    # DataSource entries under source_metadata land in the cache as plain
+    # dicts; nothing downstream relies on them being dataclass instances
+    if is_dataclass(obj):
+        return asdict(obj)
+    return str(obj)
+
+
+def _parse_cache_put(kind: str, digest: str, payload: Dict[str, Any]):
+    path = os.path.join(_PARSE_CACHE_DIR, f"{kind}-{digest}.json")
+    tmp_path = path + ".tmp"
+    try:
+        os.makedirs(_PARSE_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, default=_cache_json_default)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"[ParseCache] Write error: {e}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
 @dataclass
 class DataSource:
     file_path: str
@@ -29,6 +79,54 @@ class DataSource:
 _YEAR_RE = re.compile(r"(?:FY\s?)?((?:20|19)\d{2})|(?:FY\s?)(\d{2})", re.IGNORECASE)
 
 
+@dataclass(frozen=True)
+class _PatternSet:
+    """All hot-path regexes, compiled once at import time.
+
+    Prefork workers (Gunicorn/Celery) inherit these via copy-on-write, so
+    no worker pays compile latency on its first request.
+    """
+    kpis: Dict[str, "re.Pattern"]
+    flags: Dict[str, "re.Pattern"]
+    fiscal_year: "re.Pattern"
+    revenue_figures: "re.Pattern"
+    ebitda_figures: "re.Pattern"
+    cagr: "re.Pattern"
+    ebitda_margin: "re.Pattern"
+    pat_margin: "re.Pattern"
+
+
+_PATTERNS = _PatternSet(
+    kpis={
+        "ebitda_margin": re.compile(r"EBITDA\s*Margin\s*[:\-]?\s*([~]?\d{1,2}\.?\d{0,2}\s*%)", re.IGNORECASE),
+        "pat_margin": re.compile(r"(?:PAT|Net\s+Profit)\s*Margin\s*[:\-]?\s*([~]?\d{1,2}\.?\d{0,2}\s*%)", re.IGNORECASE),
+        "roe": re.compile(r"\bRo[EA]\b\s*[:\-]?\s*([~]?\d{1,2}\.?\d{0,2}\s*%)", re.IGNORECASE),
+        "roce": re.compile(r"\bRoCE\b\s*[:\-]?\s*([~]?\d{1,2}\.?\d{0,2}\s*%)", re.IGNORECASE),
+        "revenue_cagr": re.compile(r"Revenue\s*CAGR\s*[:\-]?\s*([~]?\d{1,2}\.?\d{0,2}\s*%)", re.IGNORECASE),
+        "employees": re.compile(r"(?:Employees?|Headcount|Team\s+Size)\s*[:\-]?\s*([\d,]+(?:\+)?)", re.IGNORECASE),
+        "facilities": re.compile(r"(?:Facilities?|Plants?|Units?)\s*[:\-]?\s*(\d+)", re.IGNORECASE),
+        "countries": re.compile(r"(?:Countries|Markets)\s*[:\-]?\s*(\d+\+?)", re.IGNORECASE),
+        "customers": re.compile(r"(?:Customers?|Clients?)\s*[:\-]?\s*([\d,]+\+?)", re.IGNORECASE),
+    },
+    flags={
+        "zero_debt": re.compile(r"\bzero\s+debt\b", re.IGNORECASE),
+        "profitable": re.compile(r"\bprofitable\b|\bprofit\s+making\b", re.IGNORECASE),
+        "iso_certified": re.compile(r"\bISO\s*\d{4}\b", re.IGNORECASE),
+        "who_gmp": re.compile(r"\bWHO[\-\s]?GMP\b", re.IGNORECASE),
+        "fda_approved": re.compile(r"\bFDA\s*(?:approved|approval)\b", re.IGNORECASE),
+    },
+    fiscal_year=re.compile(r'\b(?:FY|CY)?[\'"]?(\d{2,4})\b'),
+    revenue_figures=re.compile(
+        r'(?:revenue|sales|turnover)[^\d]*?(\d{1,5}(?:[.,]\d{1,2})?)\s*(?:Cr|crore|M|million)?',
+        re.IGNORECASE
+    ),
+    ebitda_figures=re.compile(r'EBITDA[^\d]*?(\d{1,4}(?:[.,]\d{1,2})?)', re.IGNORECASE),
+    cagr=re.compile(r'(?:CAGR|growth)\s*[:\-]?\s*~?(\d{1,2}(?:\.\d)?)\s*%', re.IGNORECASE),
+    ebitda_margin=re.compile(r'EBITDA\s*(?:margin)?\s*[:\-]?\s*~?(\d{1,2}(?:\.\d)?)\s*%', re.IGNORECASE),
+    pat_margin=re.compile(r'(?:PAT|Net\s*Profit)\s*(?:margin)?\s*[:\-]?\s*~?(\d{1,2}(?:\.\d)?)\s*%', re.IGNORECASE),
+)
+
+
 def _to_number(val: Any) -> float | None:
     """Convert various formats to float"""
     if val is None:
@@ -296,9 +394,19 @@ class DataParser:
             "source_file": file_path,
             "financials": None
         }
-        
+
         try:
-            doc = fitz.open(file_path)
+            with open(file_path, "rb") as fh:
+                pdf_bytes = fh.read()
+            digest = _content_digest(pdf_bytes)
+            cached = _parse_cache_get("pdf", digest)
+            if cached is not None:
+                cached["source_file"] = file_path
+                return cached
+
+            # The bytes are already in memory for hashing; feed them straight
+            # to PyMuPDF so the file isn't read from disk a second time
+            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
             results["page_count"] = len(doc)
             
             # Extract text from all pages
@@ -325,9 +433,10 @@ class DataParser:
                             break
                 except Exception as e:
                     print(f"[DataParser] Camelot error: {e}")
-            
+
+            _parse_cache_put("pdf", digest, results)
             return results
-            
+
         except Exception as e:
             print(f"[DataParser] PDF Error: {e}")
             return {"error": str(e), "source_file": file_path}
@@ -336,32 +445,17 @@ class DataParser:
     def _extract_kpis(text: str) -> Dict[str, Any]:
         """Extract key performance indicators from text"""
         kpis = {}
-        
+
         # Financial metrics
-        patterns = {
-            "ebitda_margin": r"EBITDA\s*Margin\s*[:\-]?\s*([~]?\d{1,2}\.?\d{0,2}\s*%)",
-            "pat_margin": r"(?:PAT|Net\s+Profit)\s*Margin\s*[:\-]?\s*([~]?\d{1,2}\.?\d{0,2}\s*%)",
-            "roe": r"\bRo[EA]\b\s*[:\-]?\s*([~]?\d{1,2}\.?\d{0,2}\s*%)",
-            "roce": r"\bRoCE\b\s*[:\-]?\s*([~]?\d{1,2}\.?\d{0,2}\s*%)",
-            "revenue_cagr": r"Revenue\s*CAGR\s*[:\-]?\s*([~]?\d{1,2}\.?\d{0,2}\s*%)",
-            "employees": r"(?:Employees?|Headcount|Team\s+Size)\s*[:\-]?\s*([\d,]+(?:\+)?)",
-            "facilities": r"(?:Facilities?|Plants?|Units?)\s*[:\-]?\s*(\d+)",
-            "countries": r"(?:Countries|Markets)\s*[:\-]?\s*(\d+\+?)",
-            "customers": r"(?:Customers?|Clients?)\s*[:\-]?\s*([\d,]+\+?)",
-        }
-        
-        for key, pattern in patterns.items():
-            match = re.search(pattern, text, flags=re.IGNORECASE)
+        for key, pattern in _PATTERNS.kpis.items():
+            match = pattern.search(text)
             if match:
                 kpis[key] = match.group(1).strip()
-        
+
         # Boolean flags
-        kpis["zero_debt"] = bool(re.search(r"\bzero\s+debt\b", text, re.IGNORECASE))
-        kpis["profitable"] = bool(re.search(r"\bprofitable\b|\bprofit\s+making\b", text, re.IGNORECASE))
-        kpis["iso_certified"] = bool(re.search(r"\bISO\s*\d{4}\b", text, re.IGNORECASE))
-        kpis["who_gmp"] = bool(re.search(r"\bWHO[\-\s]?GMP\b", text, re.IGNORECASE))
-        kpis["fda_approved"] = bool(re.search(r"\bFDA\s*(?:approved|approval)\b", text, re.IGNORECASE))
-        
+        for key, pattern in _PATTERNS.flags.items():
+            kpis[key] = bool(pattern.search(text))
+
         return kpis
 
     @staticmethod
@@ -439,7 +533,12 @@ class DocumentExtractor:
         """
         if not text:
             return {}
-        
+
+        digest = _content_digest(text.encode("utf-8", "ignore"))
+        cached = _parse_cache_get("narrative", digest)
+        if cached is not None:
+            return cached
+
         result = {
             "slide_1": {},
             "slide_3": {},
@@ -514,6 +613,7 @@ class DocumentExtractor:
             result["_extracted_fields"].append("global_reach")
         
         print(f"[DocumentExtractor] Extracted fields: {result['_extracted_fields']}")
+        _parse_cache_put("narrative", digest, result)
         return result
     
     @staticmethod
@@ -772,7 +872,7 @@ class DocumentExtractor:
         financials = {}
         
         # Try to find year patterns (FY22, 2023, FY24, etc.)
-        year_patterns = re.findall(r'\b(?:FY|CY)?[\'"]?(\d{2,4})\b', text)
+        year_patterns = _PATTERNS.fiscal_year.findall(text)
         fiscal_years = []
         for y in year_patterns:
             try:
@@ -782,7 +882,7 @@ class DocumentExtractor:
                     year = int(y)
                 if 2018 <= year <= 2030:
                     fiscal_years.append(f"FY{str(year)[-2:]}")
-            except:
+            except (ValueError, TypeError):
                 pass
         
         # Deduplicate and sort years
@@ -791,42 +891,36 @@ class DocumentExtractor:
             financials["years"] = fiscal_years
         
         # Try to extract revenue figures (look for Cr, Crore, million, INR patterns)
-        revenue_matches = re.findall(
-            r'(?:revenue|sales|turnover)[^\d]*?(\d{1,5}(?:[.,]\d{1,2})?)\s*(?:Cr|crore|M|million)?',
-            text, re.IGNORECASE
-        )
+        revenue_matches = _PATTERNS.revenue_figures.findall(text)
         if revenue_matches:
             try:
                 revenues = [float(r.replace(',', '')) for r in revenue_matches[:5]]
                 if revenues:
                     financials["revenue"] = revenues
-            except:
+            except (ValueError, TypeError):
                 pass
         
         # Extract EBITDA
-        ebitda_matches = re.findall(
-            r'EBITDA[^\d]*?(\d{1,4}(?:[.,]\d{1,2})?)',
-            text, re.IGNORECASE
-        )
+        ebitda_matches = _PATTERNS.ebitda_figures.findall(text)
         if ebitda_matches:
             try:
                 ebitda = [float(e.replace(',', '')) for e in ebitda_matches[:5]]
                 if ebitda:
                     financials["ebitda"] = ebitda
-            except:
+            except (ValueError, TypeError):
                 pass
         
         # Extract growth rates / CAGR
-        cagr_match = re.search(r'(?:CAGR|growth)\s*[:\-]?\s*~?(\d{1,2}(?:\.\d)?)\s*%', text, re.IGNORECASE)
+        cagr_match = _PATTERNS.cagr.search(text)
         if cagr_match:
             financials["revenue_cagr"] = cagr_match.group(1) + "%"
         
         # Extract margins
-        ebitda_margin = re.search(r'EBITDA\s*(?:margin)?\s*[:\-]?\s*~?(\d{1,2}(?:\.\d)?)\s*%', text, re.IGNORECASE)
+        ebitda_margin = _PATTERNS.ebitda_margin.search(text)
         if ebitda_margin:
             financials["ebitda_margin"] = ebitda_margin.group(1) + "%"
         
-        pat_margin = re.search(r'(?:PAT|Net\s*Profit)\s*(?:margin)?\s*[:\-]?\s*~?(\d{1,2}(?:\.\d)?)\s*%', text, re.IGNORECASE)
+        pat_margin = _PATTERNS.pat_margin.search(text)
         if pat_margin:
             financials["pat_margin"] = pat_margin.group(1) + "%"
         
@@ -11,10 +11,20 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.chart.data import CategoryChartData
 from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
 from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from copy import deepcopy
+import functools
 import os
+import re
+import hashlib
+import json
 import random
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 import tempfile
 import io
 import urllib.parse
@@ -25,9 +35,157 @@ except ImportError:
 
 # For advanced logo discovery
 try:
-    from app.services.scraper import ScraperService
+    from app.services.scraper import ScraperService, _BS_PARSER
 except ImportError:
     ScraperService = None
+    _BS_PARSER = 'html.parser'
+
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
+    _INFOBOX_STRAINER = SoupStrainer('table')
+except ImportError:
+    BeautifulSoup = None
+    _INFOBOX_STRAINER = None
+
+try:
+    from googlesearch import search as google_search
+except Exception:
+    google_search = None
+
+# Optional compact negative cache for logo lookups
+try:
+    from pybloom_live import BloomFilter
+except ImportError:
+    BloomFilter = None
+
+# Persistent logo cache shared across generator instances / runs
+_LOGO_CACHE_DIR = os.path.expanduser("~/.cache/kelp/logos")
+_LOGO_MANIFEST_PATH = os.path.join(_LOGO_CACHE_DIR, "manifest.json")
+_LOGO_BLOOM_PATH = os.path.join(_LOGO_CACHE_DIR, "misses.bloom")
+
+# Reusable <a:ln><a:noFill/></a:ln> template; deepcopy is cheaper than the
+# _LineFormat property chain that line.fill.background() walks per shape
+_NO_LINE_XML = (
+    '<a:ln xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+    '<a:noFill/></a:ln>'
+)
+_NO_LINE_TMPL = None
+
+# Pre-built rounded-rectangle <p:sp> markup for _add_box: one str.format +
+# parse_xml per box bypasses the descriptor chains behind add_shape/fill/line.
+# Slide content is data-dependent, so templating stays at the shape level
+# rather than whole-slide XML.
+_BOX_SP_XML = (
+    '<p:sp xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+    ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+    '<p:nvSpPr><p:cNvPr id="{sid}" name="Box {sid}"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr>'
+    '<a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="roundRect"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="{rgb}"/></a:solidFill>'
+    '<a:ln><a:noFill/></a:ln>'
+    '</p:spPr>'
+    '<p:txBody><a:bodyPr rtlCol="0"/><a:lstStyle/>'
+    '<a:p><a:endParaRPr lang="en-US"/></a:p></p:txBody>'
+    '</p:sp>'
+)
+
+# Per-color <p:bg> templates for slide backgrounds, parsed once and deepcopied
+_BG_XML = (
+    '<p:bg xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+    ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+    '<p:bgPr><a:solidFill><a:srgbClr val="{rgb}"/></a:solidFill><a:effectLst/></p:bgPr>'
+    '</p:bg>'
+)
+_BG_TMPLS: Dict[str, Any] = {}
+
+# Certification -> issuing body domain (keys are uppercase for exact lookup),
+# shared across generator instances with its substring regex compiled eagerly
+_CERT_DOMAINS = {
+    "ISO 9001": "iso.org",
+    "ISO 14001": "iso.org",
+    "ISO 22000": "iso.org",
+    "ISO 27001": "iso.org",
+    "WHO-GMP": "who.int",
+    "FDA": "fda.gov",
+    "FSSAI": "fssai.gov.in",
+    "HACCP": "haccp.com",
+    "BRC": "brcgs.com",
+    "IATF 16949": "iatfglobaloversight.org",
+    "OHSAS 18001": "iso.org",
+    "REACH": "echa.europa.eu",
+    "GDPR": "gdpr.eu",
+    "SOC 2": "aicpa.org",
+    "SEDEX": "sedex.com",
+    "SA 8000": "sa-intl.org"
+}
+_CERT_SUB_RE = re.compile("|".join(re.escape(k) for k in sorted(_CERT_DOMAINS, key=len, reverse=True)))
+
+# Default template bytes, read once per process and shared by all instances
+_DEFAULT_PPTX_BYTES = None
+
+
+def _default_template_stream() -> io.BytesIO:
+    """Read python-pptx's default template from disk once, then serve from memory"""
+    global _DEFAULT_PPTX_BYTES
+    if _DEFAULT_PPTX_BYTES is None:
+        import pptx
+        template_path = os.path.join(os.path.dirname(pptx.__file__), "templates", "default.pptx")
+        with open(template_path, "rb") as f:
+            _DEFAULT_PPTX_BYTES = f.read()
+    return io.BytesIO(_DEFAULT_PPTX_BYTES)
+
+
+_EMU_PER_INCH = 914400
+
+
+def _emu(v) -> int:
+    """Inches -> EMU as a plain int, skipping per-call Emu object construction"""
+    return int(v * _EMU_PER_INCH)
+
+
+# Shared fallback content: built once, read-only (callers only slice/read)
+_DEFAULT_ASSETS = [
+    {"label": "Manufacturing\nUnits", "value": "3"},
+    {"label": "R&D\nCenters", "value": "1"},
+    {"label": "Employees", "value": "500+"},
+    {"label": "Years in\nBusiness", "value": "15+"}
+]
+
+_DEFAULT_PORTFOLIO = [
+    {"category": "Core Products", "details": "Primary revenue driver with market leadership"},
+    {"category": "Specialty Range", "details": "High-margin differentiated products"},
+    {"category": "Contract Services", "details": "B2B manufacturing and export services"},
+    {"category": "New Launches", "details": "Pipeline products for growth markets"}
+]
+
+_DEFAULT_APPLICATIONS = [
+    {"industry": "Primary Sector", "share": "40%"},
+    {"industry": "Secondary Sector", "share": "25%"},
+    {"industry": "Tertiary Sector", "share": "20%"},
+    {"industry": "Others", "share": "15%"}
+]
+
+_DEFAULT_INVESTMENT_HIGHLIGHTS = [
+    {"title": "Market Leadership", "desc": "Established brand with strong market position and customer loyalty in core segments"},
+    {"title": "Diversified Portfolio", "desc": "Balanced product mix reducing concentration risk with multiple revenue streams"},
+    {"title": "Scalable Operations", "desc": "Modern infrastructure with expansion capacity to support 2x growth"},
+    {"title": "Experienced Team", "desc": "Strong management with 20+ years average industry experience"},
+    {"title": "Growth Trajectory", "desc": "Consistent 20%+ CAGR with improving margins and operational efficiency"},
+    {"title": "Clear Roadmap", "desc": "Well-defined expansion plans including new facilities and market entry"}
+]
+
+
+@functools.lru_cache(maxsize=32)
+def _sector_certs(sector_lower: str) -> List[str]:
+    """Map a lowercased sector name to its certification list (cached per sector)"""
+    if "pharma" in sector_lower or "health" in sector_lower:
+        return PPTGenerator.CERTIFICATIONS["pharma"]
+    elif "food" in sector_lower or "fmcg" in sector_lower or "consumer" in sector_lower:
+        return PPTGenerator.CERTIFICATIONS["food"]
+    elif "manufactur" in sector_lower:
+        return PPTGenerator.CERTIFICATIONS["manufacturing"]
+    return PPTGenerator.CERTIFICATIONS["general"]
 
 
 class PPTGenerator:
@@ -46,6 +204,12 @@ class PPTGenerator:
     GREEN = RGBColor(40, 167, 69)
     
     CODENAMES = ["Apex", "Stellar", "Horizon", "Summit", "Pinnacle", "Atlas", "Titan", "Phoenix", "Orion", "Eclipse", "Nova", "Zenith"]
+
+    # Business suffixes stripped from company names before logo lookup
+    _SUFFIX_RE = re.compile(
+        r"\b(ltd|limited|pvt|private|inc|corp|llc|llp|co|solutions|technologies|systems|services|group|holdings)\b",
+        re.IGNORECASE
+    )
     
     # Common certifications
     CERTIFICATIONS = {
@@ -58,13 +222,62 @@ class PPTGenerator:
     def __init__(self, output_path: str, data: Dict[str, Any]):
         self.output_path = output_path
         self.data = data
-        self.prs = Presentation()
+        try:
+            self.prs = Presentation(_default_template_stream())
+        except Exception:
+            self.prs = Presentation()
         self.prs.slide_width = Inches(13.33)
         self.prs.slide_height = Inches(7.5)
         self.codename = f"Project {random.choice(self.CODENAMES)}"
         self.sector = data.get("sector", "General Business")
-        self.temp_images = []  # Track temp image files for cleanup
-        self.logo_cache = {}  # Cache downloaded logos
+        self._image_buffers = []  # In-memory image buffers held for the render's lifetime
+        self.logo_cache = self._load_logo_manifest()  # Persistent logo cache (None = known miss)
+        self._miss_bloom = self._load_miss_bloom()  # Compact known-miss filter (or None)
+        self._cert_prefetch = {}  # domain -> icon bytes (or None for a miss)
+        # Shared connection pool: amortizes TCP/TLS setup across all logo fetches
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._executor = ThreadPoolExecutor(max_workers=5)  # Parallel logo probes
+        # Warm TLS to the hosts every deck hits; by the time a slide asks for
+        # an image the handshake has already happened in the background
+        for host in ("https://logo.clearbit.com/", "https://en.wikipedia.org/"):
+            self._executor.submit(self._warm_host, host)
+        self._patch_partname_allocation()
+
+    def _warm_host(self, url: str):
+        """Fire-and-forget HEAD to pre-establish a pooled connection"""
+        try:
+            self.session.head(url, timeout=2)
+        except Exception:
+            pass
+
+    def _patch_partname_allocation(self):
+        """Make part-name allocation O(1) instead of O(N) per insert.
+
+        python-pptx rescans all existing package parts to find the next free
+        partname every time a shape/image/chart part is added, which makes
+        deck construction quadratic in part count. Replace the package's
+        next_partname with an increment-only counter per template, seeded
+        from the original scan once.
+        """
+        try:
+            from pptx.opc.packuri import PackURI
+            package = self.prs.part.package
+            original_next_partname = package.next_partname
+            counters = {}
+
+            def next_partname(tmpl):
+                n = counters.get(tmpl)
+                if n is None:
+                    n = original_next_partname(tmpl).idx
+                counters[tmpl] = n + 1
+                return PackURI(tmpl % n)
+
+            package.next_partname = next_partname
+        except Exception as e:
+            print(f"[PPTGenerator] Partname patch skipped: {e}")
 
     def generate(self) -> str:
         try:
@@ -72,38 +285,44 @@ class PPTGenerator:
             self._slide_2_business_overview()
             self._slide_3_financial_performance()
             self._slide_4_investment_highlights()
-            self.prs.save(self.output_path)
+            # Large write buffer coalesces the many small ZIP-part writes
+            with open(self.output_path, 'wb', buffering=1 << 20) as f:
+                self.prs.save(f)
             print(f"[PPTGenerator] Saved: {self.output_path}")
             return self.output_path
         except Exception as e:
             print(f"[PPTGenerator] Error: {e}")
             raise
+        finally:
+            self._save_logo_manifest()
+            self._save_miss_bloom()
+            self._executor.shutdown(wait=False)
+            self.session.close()
 
     # ==================== SLIDE 1: TITLE ====================
     def _slide_1_title(self):
         slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
         # Navy background
-        slide.background.fill.solid()
-        slide.background.fill.fore_color.rgb = self.NAVY
+        self._set_bg(slide, self.NAVY)
         
         # Logo placeholder
-        self._add_box(slide, 0.4, 0.4, 2.2, 0.7, self.WHITE)
-        self._add_text(slide, 0.5, 0.48, 2.0, 0.55, "KELP", 26, self.NAVY, bold=True)
-        
+        logo_box = self._add_box(slide, 0.4, 0.4, 2.2, 0.7, self.WHITE)
+        self._add_text_in_shape(logo_box, "KELP", 26, self.NAVY, bold=True)
+
         # Project name (significantly larger)
         self._add_text(slide, 0.4, 2.5, 9.0, 1.6, self.codename, 72, self.WHITE, bold=True)
-        
+
         # Sector badge (larger)
-        self._add_box(slide, 0.4, 4.3, 5.0, 0.7, self.LIGHT_TEAL)
-        self._add_text(slide, 0.5, 4.38, 4.8, 0.55, self.sector.upper(), 22, self.WHITE, bold=True)
+        sector_badge = self._add_box(slide, 0.4, 4.3, 5.0, 0.7, self.LIGHT_TEAL)
+        self._add_text_in_shape(sector_badge, self.sector.upper(), 22, self.WHITE, bold=True)
         
         # Tagline (larger)
         self._add_text(slide, 0.4, 5.3, 9.0, 0.8, self.data.get("tagline", "UNLEASHING STRATEGIC VALUE"), 16, self.WHITE, italic=True)
         self._add_text(slide, 0.4, 5.7, 7.0, 0.6, "Investment Teaser | Strictly Confidential", 16, self.WHITE)
         
         # Right side visual
-        self._add_box(slide, 9.0, 0.8, 4.0, 6.0, RGBColor(40, 60, 100))
-        self._add_text(slide, 9.2, 3.0, 3.6, 1.0, "Company\nVisual", 28, RGBColor(80, 100, 140), center=True)
+        visual_box = self._add_box(slide, 9.0, 0.8, 4.0, 6.0, RGBColor(40, 60, 100))
+        self._add_text_in_shape(visual_box, "Company\nVisual", 28, RGBColor(80, 100, 140), center=True)
         
         # Footer
         self._add_text(slide, 0.4, 7.0, 12.5, 0.35, "kelpglobal.com", 12, self.WHITE, center=True)
@@ -111,8 +330,7 @@ class PPTGenerator:
     # ==================== SLIDE 2: BUSINESS OVERVIEW ====================
     def _slide_2_business_overview(self):
         slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
-        slide.background.fill.solid()
-        slide.background.fill.fore_color.rgb = self.LIGHT_GRAY
+        self._set_bg(slide, self.LIGHT_GRAY)
         
         # Header
         self._add_header(slide, "Business Overview")
@@ -129,6 +347,12 @@ class PPTGenerator:
         # Key Select Customers
         self._add_section_header(slide, 0.3, 2.8, "KEY SELECT CUSTOMERS")
         customers = narrative.get("customers", ["Customer A", "Customer B", "Customer C", "Customer D", "Customer E", "Customer F"])
+
+        # Warm all customer + cert lookups in one batch before layout starts
+        certs = narrative.get("certifications", self._get_sector_certs())
+        cert_domains = [d for d in (self._resolve_cert_domain(c) for c in certs) if d]
+        self._prefetch_all_logos(customers[:6], cert_domains)
+
         self._add_customer_grid(slide, 0.3, 3.05, 6.1, customers[:6])
         
         # Company at a Glance (Assets Grid)
@@ -138,7 +362,6 @@ class PPTGenerator:
         
         # Certifications
         self._add_section_header(slide, 0.3, 5.85, "CERTIFICATIONS & ACCREDITATIONS")
-        certs = narrative.get("certifications", self._get_sector_certs())
         self._add_certification_row(slide, 0.3, 6.1, 6.1, certs)
         
         # === RIGHT COLUMN (6.6 - 12.9) ===
@@ -163,8 +386,7 @@ class PPTGenerator:
     # ==================== SLIDE 3: FINANCIAL PERFORMANCE ====================
     def _slide_3_financial_performance(self):
         slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
-        slide.background.fill.solid()
-        slide.background.fill.fore_color.rgb = self.LIGHT_GRAY
+        self._set_bg(slide, self.LIGHT_GRAY)
         
         self._add_header(slide, "Financial Performance & Global Presence")
         
@@ -181,8 +403,13 @@ class PPTGenerator:
         self._add_section_header(slide, 0.3, 2.4, "REVENUE & EBITDA TREND")
         years = financials.get("years", ["FY21", "FY22", "FY23", "FY24"])
         revenue = financials.get("revenue", [100, 125, 160, 200])
-        if len(years) >= 2:
+        if len(years) >= 2 and any(revenue) and len(set(revenue)) > 1:
             self._add_combo_chart(slide, 0.3, 2.65, 5.5, 2.2, years, revenue, financials.get("ebitda", []))
+        else:
+            # Flat/empty series carry no trend; skip the chart (and its embedded
+            # xlsx part) in favour of a one-line summary
+            summary = f"Revenue of ₹{revenue[-1]} Cr ({years[0]}–{years[-1]})" if revenue else "Financial trend data not available."
+            self._add_content_box(slide, 0.3, 2.65, 5.5, 2.2, summary, 11)
         
         # === RIGHT: Global Presence ===
         self._add_section_header(slide, 6.0, 2.4, "GLOBAL PRESENCE")
@@ -218,8 +445,7 @@ class PPTGenerator:
     # ==================== SLIDE 4: INVESTMENT HIGHLIGHTS ====================
     def _slide_4_investment_highlights(self):
         slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
-        slide.background.fill.solid()
-        slide.background.fill.fore_color.rgb = self.LIGHT_GRAY
+        self._set_bg(slide, self.LIGHT_GRAY)
         
         self._add_header(slide, "Investment Highlights")
         
@@ -243,12 +469,12 @@ class PPTGenerator:
             self._add_investment_card(slide, x, y, card_w, card_h, i+1, hl.get("title", ""), hl.get("desc", ""))
         
         # Bottom Summary Box
-        self._add_box(slide, 0.4, 5.2, 12.5, 1.6, self.NAVY)
-        self._add_text(slide, 0.6, 5.3, 12.1, 0.45, "WHY INVEST?", 22, self.LIGHT_TEAL, bold=True)
-        
-        why_invest = narrative.get("why_invest", 
+        summary_box = self._add_box(slide, 0.4, 5.2, 12.5, 1.6, self.NAVY)
+        self._add_text_in_shape(summary_box, "WHY INVEST?", 22, self.LIGHT_TEAL, bold=True, v_center=False)
+
+        why_invest = narrative.get("why_invest",
             "Strong market position with consistent growth trajectory, experienced management team, diversified revenue streams, and clear expansion roadmap make this an attractive investment opportunity with significant upside potential.")
-        self._add_text(slide, 0.6, 5.75, 12.1, 0.95, why_invest, 15, self.WHITE)
+        self._append_paragraph_in_shape(summary_box, why_invest, 15, self.WHITE)
         
         self._add_footer(slide)
 
@@ -256,10 +482,10 @@ class PPTGenerator:
     
     def _add_header(self, slide, title: str):
         # Header bar
-        bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, Inches(13.33), Inches(0.9))
+        bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, _emu(13.33), _emu(0.9))
         bar.fill.solid()
         bar.fill.fore_color.rgb = self.NAVY
-        bar.line.fill.background()
+        self._set_no_line(bar)
         
         # Logo
         self._add_text(slide, 0.3, 0.25, 2.0, 0.4, "KELP", 26, self.WHITE, bold=True)
@@ -271,25 +497,68 @@ class PPTGenerator:
         self._add_text(slide, 10.5, 0.25, 2.5, 0.4, self.codename, 16, self.LIGHT_TEAL)
 
     def _add_footer(self, slide):
-        line = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, Inches(7.1), Inches(13.33), Inches(0.02))
+        line = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, _emu(7.1), _emu(13.33), _emu(0.02))
         line.fill.solid()
         line.fill.fore_color.rgb = self.MED_GRAY
-        line.line.fill.background()
+        self._set_no_line(line)
         
         self._add_text(slide, 0.3, 7.15, 12.7, 0.25, "Strictly Private & Confidential | Prepared by Kelp M&A Team", 9, self.DARK_GRAY, center=True)
 
     def _add_section_header(self, slide, x, y, text):
         self._add_text(slide, x, y, 6.0, 0.3, text, 14, self.TEAL, bold=True)
 
+    @staticmethod
+    def _set_bg(slide, rgb):
+        """Set a solid slide background via a cached <p:bg> template (one insert)"""
+        try:
+            key = str(rgb)
+            tmpl = _BG_TMPLS.get(key)
+            if tmpl is None:
+                tmpl = _BG_TMPLS[key] = parse_xml(_BG_XML.format(rgb=key))
+            cSld = slide._element.cSld
+            existing = cSld.find(qn('p:bg'))
+            if existing is not None:
+                cSld.remove(existing)
+            cSld.insert(0, deepcopy(tmpl))
+        except Exception:
+            slide.background.fill.solid()
+            slide.background.fill.fore_color.rgb = rgb
+
+    @staticmethod
+    def _set_no_line(shape):
+        """Apply the cached no-line XML template instead of line.fill.background()"""
+        global _NO_LINE_TMPL
+        try:
+            if _NO_LINE_TMPL is None:
+                _NO_LINE_TMPL = parse_xml(_NO_LINE_XML)
+            spPr = shape._element.spPr
+            existing = spPr.find(qn('a:ln'))
+            if existing is not None:
+                spPr.remove(existing)
+            spPr.append(deepcopy(_NO_LINE_TMPL))
+        except Exception:
+            shape.line.fill.background()
+
     def _add_box(self, slide, x, y, w, h, color):
-        shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(x), Inches(y), Inches(w), Inches(h))
-        shape.fill.solid()
-        shape.fill.fore_color.rgb = color
-        shape.line.fill.background()
-        return shape
+        try:
+            # Fast path: render the whole shape from the pre-built template
+            shapes = slide.shapes
+            sp = parse_xml(_BOX_SP_XML.format(
+                sid=shapes._next_shape_id,
+                x=_emu(x), y=_emu(y), cx=_emu(w), cy=_emu(h),
+                rgb=str(color)
+            ))
+            shapes._spTree.append(sp)
+            return shapes._shape_factory(sp)
+        except Exception:
+            shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, _emu(x), _emu(y), _emu(w), _emu(h))
+            shape.fill.solid()
+            shape.fill.fore_color.rgb = color
+            self._set_no_line(shape)
+            return shape
 
     def _add_content_box(self, slide, x, y, w, h, text, font_size):
-        box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(x), Inches(y), Inches(w), Inches(h))
+        box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, _emu(x), _emu(y), _emu(w), _emu(h))
         box.fill.solid()
         box.fill.fore_color.rgb = self.WHITE
         box.line.color.rgb = self.MED_GRAY
@@ -298,10 +567,10 @@ class PPTGenerator:
         tf = box.text_frame
         tf.word_wrap = True
         tf.vertical_anchor = MSO_ANCHOR.MIDDLE
-        tf.margin_left = Inches(0.12)
-        tf.margin_right = Inches(0.12)
-        tf.margin_top = Inches(0.08)
-        tf.margin_bottom = Inches(0.08)
+        tf.margin_left = _emu(0.12)
+        tf.margin_right = _emu(0.12)
+        tf.margin_top = _emu(0.08)
+        tf.margin_bottom = _emu(0.08)
         p = tf.paragraphs[0]
         p.text = str(text)
         p.font.size = Pt(font_size)
@@ -310,8 +579,41 @@ class PPTGenerator:
         p.alignment = PP_ALIGN.LEFT
         return box
 
+    def _add_text_in_shape(self, shape, text, size, color, bold=False, center=False, italic=False, v_center=True):
+        """Write text into a shape's own text frame instead of overlaying a textbox"""
+        tf = shape.text_frame
+        tf.word_wrap = True
+        if v_center:
+            tf.vertical_anchor = MSO_ANCHOR.MIDDLE
+        tf.margin_left = Pt(5)
+        tf.margin_right = Pt(5)
+        tf.margin_top = Pt(2)
+        tf.margin_bottom = Pt(2)
+        p = tf.paragraphs[0]
+        p.text = str(text)
+        p.font.size = Pt(size)
+        p.font.color.rgb = color
+        p.font.bold = bold
+        p.font.italic = italic
+        p.line_spacing = 1.1
+        if center:
+            p.alignment = PP_ALIGN.CENTER
+        return shape
+
+    def _append_paragraph_in_shape(self, shape, text, size, color, bold=False, center=False):
+        """Add a second styled paragraph to a shape's text frame"""
+        p = shape.text_frame.add_paragraph()
+        p.text = str(text)
+        p.font.size = Pt(size)
+        p.font.color.rgb = color
+        p.font.bold = bold
+        p.line_spacing = 1.1
+        if center:
+            p.alignment = PP_ALIGN.CENTER
+        return p
+
     def _add_text(self, slide, x, y, w, h, text, size, color, bold=False, center=False, italic=False, v_center=True):
-        box = slide.shapes.add_textbox(Inches(x), Inches(y), Inches(w), Inches(h))
+        box = slide.shapes.add_textbox(_emu(x), _emu(y), _emu(w), _emu(h))
         tf = box.text_frame
         tf.word_wrap = True
         
@@ -338,132 +640,153 @@ class PPTGenerator:
         """Add customer logos/names in a grid - attempts to fetch real logos"""
         box_w = (w - 0.25) / 3
         box_h = 0.5
-        
-        for i, cust in enumerate(customers[:6]):
+
+        # Bind hot names once; saves repeated attribute walks inside the loop
+        _box, _logo, _text_in = self._add_box, self._try_add_logo, self._add_text_in_shape
+        med_gray, white, navy = self.MED_GRAY, self.WHITE, self.NAVY
+        border_w = Pt(0.5)
+
+        # Coerce and truncate once, up front, rather than per loop body
+        names = [(str(c), str(c)[:25]) for c in customers[:6]]
+
+        for i, (full_name, short_name) in enumerate(names):
             row = i // 3
             col = i % 3
             bx = x + col * (box_w + 0.08)
             by = y + row * (box_h + 0.1)
-            
+
             # Create box background
-            box = self._add_box(slide, bx, by, box_w, box_h, self.WHITE)
-            box.line.color.rgb = self.MED_GRAY
-            box.line.width = Pt(0.5)
-            
+            box = _box(slide, bx, by, box_w, box_h, white)
+            box.line.color.rgb = med_gray
+            box.line.width = border_w
+
             # Try to add logo image
-            logo_added = self._try_add_logo(slide, str(cust), bx + 0.05, by + 0.08, box_w - 0.1, box_h - 0.16)
-            
+            logo_added = _logo(slide, full_name, bx + 0.05, by + 0.08, box_w - 0.1, box_h - 0.16)
+
             if not logo_added:
-                # If no logo, show text name (centered and oriented, larger font for Phase 4)
-                self._add_text(slide, bx, by, box_w, box_h, str(cust)[:25], 14, self.NAVY, bold=True, center=True, v_center=True)
+                # If no logo, show text name in the box's own frame (larger font for Phase 4)
+                _text_in(box, short_name, 14, navy, bold=True, center=True)
 
     def _add_assets_grid(self, slide, x, y, w, assets):
         """Add company assets (facilities, R&D, etc)"""
         box_w = (w - 0.4) / 4
         box_h = 1.0
-        
+
+        _box, _text_in, _para_in = self._add_box, self._add_text_in_shape, self._append_paragraph_in_shape
+
         for i, asset in enumerate(assets[:4]):
             bx = x + i * (box_w + 0.1)
-            
-            box = self._add_box(slide, bx, y, box_w, box_h, self.NAVY)
-            
-            # Value (larger font)
-            self._add_text(slide, bx, y + 0.1, box_w, 0.45, str(asset.get("value", "-")), 26, self.WHITE, bold=True, center=True)
-            # Label (larger font)
-            self._add_text(slide, bx, y + 0.6, box_w, 0.4, str(asset.get("label", "")), 11, self.LIGHT_TEAL, center=True)
+
+            box = _box(slide, bx, y, box_w, box_h, self.NAVY)
+
+            # Value + label share the box's own text frame (larger fonts)
+            _text_in(box, str(asset.get("value", "-")), 26, self.WHITE, bold=True, center=True)
+            _para_in(box, str(asset.get("label", "")), 11, self.LIGHT_TEAL, center=True)
 
     def _add_certification_row(self, slide, x, y, w, certs):
         """Add certification badges with icons"""
         badge_w = (w - 0.4) / 5
-        
+
+        _box, _icon, _text_in = self._add_box, self._try_add_cert_icon, self._add_text_in_shape
+        teal = self.TEAL
+        border_w = Pt(1.5)
+
         for i, cert in enumerate(certs[:5]):
             bx = x + i * (badge_w + 0.08)
-            
-            badge = self._add_box(slide, bx, y, badge_w, 0.5, self.WHITE)
-            badge.line.color.rgb = self.TEAL
-            badge.line.width = Pt(1.5)
-            
+
+            badge = _box(slide, bx, y, badge_w, 0.5, self.WHITE)
+            badge.line.color.rgb = teal
+            badge.line.width = border_w
+
             # Try to add cert icon/logo
-            cert_logo_added = self._try_add_cert_icon(slide, str(cert), bx + 0.08, y + 0.08, badge_w - 0.16, 0.35)
-            
+            cert_logo_added = _icon(slide, str(cert), bx + 0.08, y + 0.08, badge_w - 0.16, 0.35)
+
             if not cert_logo_added:
-                # Cert name (centered and oriented)
-                self._add_text(slide, bx, y, badge_w, 0.5, str(cert), 11, self.TEAL, bold=True, center=True, v_center=True)
+                # Cert name in the badge's own frame
+                _text_in(badge, str(cert), 11, teal, bold=True, center=True)
 
     def _add_product_list(self, slide, x, y, w, products):
         """Add product portfolio items"""
         item_h = 0.6
-        
-        for i, prod in enumerate(products[:4]):
+
+        add_shape = slide.shapes.add_shape
+        _box, _text_in, _para_in = self._add_box, self._add_text_in_shape, self._append_paragraph_in_shape
+        teal, med_gray = self.TEAL, self.MED_GRAY
+        border_w = Pt(0.5)
+
+        # Coerce and truncate once, up front, rather than per loop body
+        rows = [
+            (str(p.get("category", ""))[:28], str(p.get("details", ""))[:65])
+            for p in products[:4]
+        ]
+
+        for i, (category, details) in enumerate(rows):
             py = y + i * (item_h + 0.05)
-            
+
             # Colored left bar
-            bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(x), Inches(py), Inches(0.1), Inches(item_h))
+            bar = add_shape(MSO_SHAPE.RECTANGLE, _emu(x), _emu(py), _emu(0.1), _emu(item_h))
             bar.fill.solid()
-            bar.fill.fore_color.rgb = self.TEAL
-            bar.line.fill.background()
-            
-            # Content box
-            box = self._add_box(slide, x + 0.1, py, w - 0.1, item_h, self.WHITE)
-            box.line.color.rgb = self.MED_GRAY
-            box.line.width = Pt(0.5)
-            
-            # Title (larger font)
-            self._add_text(slide, x + 0.2, py + 0.08, w - 0.35, 0.3, str(prod.get("category", ""))[:28], 14, self.NAVY, bold=True)
-            # Details (larger font)
-            self._add_text(slide, x + 0.2, py + 0.35, w - 0.35, 0.3, str(prod.get("details", ""))[:65], 12, self.DARK_GRAY)
+            bar.fill.fore_color.rgb = teal
+            self._set_no_line(bar)
+
+            # Content box holds title + details in its own frame (larger fonts)
+            box = _box(slide, x + 0.1, py, w - 0.1, item_h, self.WHITE)
+            box.line.color.rgb = med_gray
+            box.line.width = border_w
+
+            _text_in(box, category, 14, self.NAVY, bold=True)
+            _para_in(box, details, 12, self.DARK_GRAY)
 
     def _add_applications_grid(self, slide, x, y, w, apps):
         """Add applications with percentage bars"""
         item_h = 0.35
-        
+
+        _box, _text_in = self._add_box, self._add_text_in_shape
+        med_gray = self.MED_GRAY
+        border_w = Pt(0.5)
+
         for i, app in enumerate(apps[:4]):
             ay = y + i * (item_h + 0.08)
-            
-            # Background
-            bg = self._add_box(slide, x, ay, w, item_h, self.WHITE)
-            bg.line.color.rgb = self.MED_GRAY
-            bg.line.width = Pt(0.5)
-            
-            # Industry name
-            self._add_text(slide, x + 0.1, ay + 0.05, w * 0.65, 0.25, str(app.get("industry", "")), 11, self.TEXT_DARK)
-            
+
+            # Background carries the industry name directly
+            bg = _box(slide, x, ay, w, item_h, self.WHITE)
+            bg.line.color.rgb = med_gray
+            bg.line.width = border_w
+            _text_in(bg, str(app.get("industry", "")), 11, self.TEXT_DARK)
+
             # Share badge
             share = str(app.get("share", ""))
-            badge = self._add_box(slide, x + w - 0.75, ay + 0.03, 0.7, 0.28, self.NAVY)
-            self._add_text(slide, x + w - 0.75, ay + 0.03, 0.7, 0.28, share, 10, self.WHITE, bold=True, center=True, v_center=True)
+            badge = _box(slide, x + w - 0.75, ay + 0.03, 0.7, 0.28, self.NAVY)
+            _text_in(badge, share, 10, self.WHITE, bold=True, center=True)
 
     def _add_revenue_bars(self, slide, x, y, w, rev_split):
         """Add horizontal revenue split bars"""
         bar_h = 0.3
         total = sum(rev_split.values()) or 1
-        
-        current_x = x
+
         colors = [self.NAVY, self.TEAL, self.LIGHT_TEAL, self.ORANGE]
-        
-        for i, (label, value) in enumerate(rev_split.items()):
-            bar_w = (value / total) * w
-            
-            bar = self._add_box(slide, current_x, y, bar_w - 0.02, bar_h, colors[i % len(colors)])
-            self._add_text(slide, current_x, y + 0.05, bar_w - 0.02, 0.2, f"{label}: {value}%", 8, self.WHITE, center=True)
-            
-            current_x += bar_w
+
+        # Vectorize the x-offset arithmetic: one cumsum instead of per-item adds
+        widths = np.asarray(list(rev_split.values()), dtype=np.float64) / total * w
+        xs = x + np.concatenate(([0.0], np.cumsum(widths)[:-1]))
+
+        for i, ((label, value), bx, bar_w) in enumerate(zip(rev_split.items(), xs, widths)):
+            bar = self._add_box(slide, bx, y, bar_w - 0.02, bar_h, colors[i % len(colors)])
+            self._add_text_in_shape(bar, f"{label}: {value}%", 8, self.WHITE, center=True)
 
     def _add_metrics_row(self, slide, x, y, w, metrics):
         """Add horizontal metrics row"""
         box_w = (w - 0.4) / len(metrics) if metrics else 1.5
-        
-        for i, m in enumerate(metrics):
-            mx = x + i * (box_w + 0.08)
-            
+        xs = x + np.arange(len(metrics), dtype=np.float64) * (box_w + 0.08)
+
+        for m, mx in zip(metrics, xs):
             box = self._add_box(slide, mx, y, box_w, 0.75, self.WHITE)
             box.line.color.rgb = self.NAVY
             box.line.width = Pt(1)
-            
-            # Value
-            self._add_text(slide, mx, y + 0.1, box_w, 0.35, str(m.get("value", "-")), 16, self.NAVY, bold=True, center=True)
-            # Label
-            self._add_text(slide, mx, y + 0.45, box_w, 0.25, str(m.get("label", "")), 7, self.DARK_GRAY, center=True)
+
+            # Value + label in the box's own frame
+            self._add_text_in_shape(box, str(m.get("value", "-")), 16, self.NAVY, bold=True, center=True)
+            self._append_paragraph_in_shape(box, str(m.get("label", "")), 7, self.DARK_GRAY, center=True)
 
     def _add_combo_chart(self, slide, x, y, w, h, years, revenue, ebitda):
         """Add bar chart for revenue"""
@@ -474,7 +797,7 @@ class PPTGenerator:
             if ebitda:
                 chart_data.add_series('EBITDA', ebitda)
             
-            chart = slide.shapes.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(x), Inches(y), Inches(w), Inches(h), chart_data).chart
+            chart = slide.shapes.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, _emu(x), _emu(y), _emu(w), _emu(h), chart_data).chart
             chart.has_legend = True
             chart.legend.position = XL_LEGEND_POSITION.BOTTOM
             chart.legend.font.size = Pt(7)
@@ -484,18 +807,20 @@ class PPTGenerator:
     def _add_market_badges(self, slide, x, y, w, markets):
         """Add export market badges"""
         badge_w = (w - 0.4) / len(markets) if markets else 1.2
-        
-        for i, market in enumerate(markets):
-            mx = x + i * (badge_w + 0.08)
+        xs = x + np.arange(len(markets), dtype=np.float64) * (badge_w + 0.08)
+
+        for market, mx in zip(markets, xs):
             badge = self._add_box(slide, mx, y, badge_w, 0.4, self.NAVY)
-            self._add_text(slide, mx, y + 0.08, badge_w, 0.28, str(market), 10, self.WHITE, center=True)
+            self._add_text_in_shape(badge, str(market), 10, self.WHITE, center=True)
 
     def _add_bullet_list(self, slide, x, y, w, items, font_size, italic=False):
         """Add bullet list"""
+        _text = self._add_text
+        teal, text_dark = self.TEAL, self.TEXT_DARK
         for i, item in enumerate(items):
             iy = y + i * 0.35
-            self._add_text(slide, x, iy, 0.15, 0.25, "•", font_size, self.TEAL, bold=True)
-            self._add_text(slide, x + 0.18, iy, w - 0.2, 0.3, str(item), font_size, self.TEXT_DARK, italic=italic)
+            _text(slide, x, iy, 0.15, 0.25, "•", font_size, teal, bold=True)
+            _text(slide, x + 0.18, iy, w - 0.2, 0.3, str(item), font_size, text_dark, italic=italic)
 
     def _add_investment_card(self, slide, x, y, w, h, num, title, desc):
         """Add investment highlight card"""
@@ -506,62 +831,70 @@ class PPTGenerator:
         
         # Number circle (larger)
         circle_size = 0.5
-        circle = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(x + 0.12), Inches(y + 0.12), Inches(circle_size), Inches(circle_size))
+        circle = slide.shapes.add_shape(MSO_SHAPE.OVAL, _emu(x + 0.12), _emu(y + 0.12), _emu(circle_size), _emu(circle_size))
         circle.fill.solid()
         circle.fill.fore_color.rgb = self.NAVY
-        circle.line.fill.background()
-        self._add_text(slide, x + 0.12, y + 0.2, circle_size, 0.32, str(num), 16, self.WHITE, bold=True, center=True)
-        
-        # Title (larger font)
-        self._add_text(slide, x + 0.7, y + 0.2, w - 0.85, 0.4, title, 16, self.NAVY, bold=True)
-        
-        # Description (larger font)
-        self._add_text(slide, x + 0.15, y + 0.75, w - 0.3, h - 0.85, desc, 14, self.DARK_GRAY, v_center=False)
+        self._set_no_line(circle)
+        self._add_text_in_shape(circle, str(num), 16, self.WHITE, bold=True, center=True)
+
+        # Title + description live in the card's own frame (indented past the circle)
+        # instead of two overlay textboxes: fewer shapes, smaller slide XML
+        self._add_text_in_shape(card, title, 16, self.NAVY, bold=True, v_center=False)
+        self._append_paragraph_in_shape(card, desc, 14, self.DARK_GRAY)
+        card.text_frame.margin_left = _emu(0.7)
+        card.text_frame.margin_top = _emu(0.2)
 
     # ==================== DATA EXTRACTION ====================
     
     def _extract_financial_metrics(self, financials, kpis):
         """Extract key financial metrics"""
         metrics = []
-        
+
         revenue = financials.get("revenue", [])
         ebitda = financials.get("ebitda", [])
-        
+        rev_arr = self._to_float_array(revenue)
+
         if revenue:
             metrics.append({"label": "Revenue (FY24)", "value": f"₹{revenue[-1]} Cr"})
             cagr = self._calc_cagr(revenue)
             if cagr:
                 metrics.append({"label": "Revenue CAGR", "value": f"{cagr}%"})
-        
+
         if ebitda and revenue:
-            margin = round((ebitda[-1] / revenue[-1]) * 100) if revenue[-1] > 0 else 0
+            ebitda_arr = self._to_float_array(ebitda)
+            if rev_arr is not None and ebitda_arr is not None and rev_arr[-1] > 0:
+                margin = int(round(ebitda_arr[-1] / rev_arr[-1] * 100))
+            else:
+                margin = 0
             metrics.append({"label": "EBITDA Margin", "value": f"{margin}%"})
-        
+
         metrics.append({"label": "RoCE", "value": kpis.get("roce", "18%")})
         metrics.append({"label": "Debt", "value": kpis.get("debt", "Low")})
-        
+
         return metrics
 
+    @staticmethod
+    def _to_float_array(series):
+        """Coerce a metric series to a float64 array, None if non-numeric/empty"""
+        if not series:
+            return None
+        try:
+            return np.asarray(series, dtype=np.float64)
+        except (ValueError, TypeError):
+            return None
+
     def _calc_cagr(self, series):
         try:
-            if len(series) < 2:
-                return None
-            valid = [x for x in series if x and float(x) > 0]
-            if len(valid) < 2:
-                return None
-            return int(round(((float(valid[-1]) / float(valid[0])) ** (1 / (len(valid) - 1)) - 1) * 100))
-        except:
+            arr = np.asarray([float(x) for x in series if x], dtype=np.float64)
+        except (ValueError, TypeError):
+            return None
+        arr = arr[arr > 0]
+        if arr.size < 2:
             return None
+        return int(round(((arr[-1] / arr[0]) ** (1 / (arr.size - 1)) - 1) * 100))
 
     def _get_sector_certs(self):
-        sector_lower = self.sector.lower()
-        if "pharma" in sector_lower or "health" in sector_lower:
-            return self.CERTIFICATIONS["pharma"]
-        elif "food" in sector_lower or "fmcg" in sector_lower or "consumer" in sector_lower:
-            return self.CERTIFICATIONS["food"]
-        elif "manufactur" in sector_lower:
-            return self.CERTIFICATIONS["manufacturing"]
-        return self.CERTIFICATIONS["general"]
+        return _sector_certs(self.sector.lower())
 
     # ==================== DEFAULTS ====================
     
@@ -569,55 +902,184 @@ class PPTGenerator:
         return f"The Company is a leading player in the {self.sector} sector with diversified operations, strong customer relationships, and established market position. Built on operational excellence with an experienced management team driving consistent growth."
 
     def _default_assets(self):
-        return [
-            {"label": "Manufacturing\nUnits", "value": "3"},
-            {"label": "R&D\nCenters", "value": "1"},
-            {"label": "Employees", "value": "500+"},
-            {"label": "Years in\nBusiness", "value": "15+"}
-        ]
+        return _DEFAULT_ASSETS
 
     def _default_portfolio(self):
-        return [
-            {"category": "Core Products", "details": "Primary revenue driver with market leadership"},
-            {"category": "Specialty Range", "details": "High-margin differentiated products"},
-            {"category": "Contract Services", "details": "B2B manufacturing and export services"},
-            {"category": "New Launches", "details": "Pipeline products for growth markets"}
-        ]
+        return _DEFAULT_PORTFOLIO
 
     def _default_applications(self):
-        return [
-            {"industry": "Primary Sector", "share": "40%"},
-            {"industry": "Secondary Sector", "share": "25%"},
-            {"industry": "Tertiary Sector", "share": "20%"},
-            {"industry": "Others", "share": "15%"}
-        ]
+        return _DEFAULT_APPLICATIONS
 
     def _default_investment_highlights(self):
-        return [
-            {"title": "Market Leadership", "desc": "Established brand with strong market position and customer loyalty in core segments"},
-            {"title": "Diversified Portfolio", "desc": "Balanced product mix reducing concentration risk with multiple revenue streams"},
-            {"title": "Scalable Operations", "desc": "Modern infrastructure with expansion capacity to support 2x growth"},
-            {"title": "Experienced Team", "desc": "Strong management with 20+ years average industry experience"},
-            {"title": "Growth Trajectory", "desc": "Consistent 20%+ CAGR with improving margins and operational efficiency"},
-            {"title": "Clear Roadmap", "desc": "Well-defined expansion plans including new facilities and market entry"}
-        ]
+        return _DEFAULT_INVESTMENT_HIGHLIGHTS
 
     # ==================== LOGO/IMAGE METHODS ====================
-    
+
+    def _load_logo_manifest(self) -> Dict[str, Any]:
+        """Load the persistent logo cache (clean_name -> cached png path, None = known miss)"""
+        try:
+            with open(_LOGO_MANIFEST_PATH, "r") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_logo_manifest(self):
+        """Atomically persist the logo cache manifest"""
+        try:
+            os.makedirs(_LOGO_CACHE_DIR, exist_ok=True)
+            tmp_path = _LOGO_MANIFEST_PATH + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self.logo_cache, f)
+            os.replace(tmp_path, _LOGO_MANIFEST_PATH)
+        except Exception as e:
+            print(f"[PPTGenerator] Logo manifest save failed: {e}")
+
+    def _load_miss_bloom(self):
+        """Load the persisted known-miss Bloom filter, or a fresh one (None if lib absent)"""
+        if BloomFilter is None:
+            return None
+        try:
+            with open(_LOGO_BLOOM_PATH, 'rb') as f:
+                return BloomFilter.fromfile(f)
+        except Exception:
+            try:
+                return BloomFilter(capacity=100000, error_rate=0.01)
+            except Exception:
+                return None
+
+    def _save_miss_bloom(self):
+        """Atomically persist the known-miss Bloom filter"""
+        if self._miss_bloom is None:
+            return
+        try:
+            os.makedirs(_LOGO_CACHE_DIR, exist_ok=True)
+            tmp_path = _LOGO_BLOOM_PATH + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                self._miss_bloom.tofile(f)
+            os.replace(tmp_path, _LOGO_BLOOM_PATH)
+        except Exception as e:
+            print(f"[PPTGenerator] Miss-filter save failed: {e}")
+
+    def _store_logo_bytes(self, clean_name: str, content: bytes) -> str:
+        """Write fetched logo bytes into the persistent cache, return the cached path"""
+        os.makedirs(_LOGO_CACHE_DIR, exist_ok=True)
+        filename = hashlib.sha1(clean_name.encode()).hexdigest() + ".png"
+        path = os.path.join(_LOGO_CACHE_DIR, filename)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    # Deck icons never need more than this; larger bodies are abandoned mid-stream
+    _MAX_IMAGE_BYTES = 512 * 1024
+
+    def _fetch_image_bytes(self, url: str, timeout: int = 3) -> Optional[bytes]:
+        """Fetch a URL and return the body bytes if it is a reasonably sized image"""
+        try:
+            with self.session.get(url, timeout=timeout, stream=True) as response:
+                if response.status_code != 200 or 'image' not in response.headers.get('content-type', ''):
+                    return None
+                if int(response.headers.get('content-length', 0)) > self._MAX_IMAGE_BYTES:
+                    return None
+                data = response.raw.read(self._MAX_IMAGE_BYTES + 1, decode_content=True)
+                if data and len(data) <= self._MAX_IMAGE_BYTES:
+                    return data
+        except Exception:
+            pass
+        return None
+
+    def _head_image_url(self, url: str, timeout: int = 2) -> bool:
+        """HEAD-probe a URL; True when it resolves to an image (no body transfer)"""
+        try:
+            response = self.session.head(url, timeout=timeout, allow_redirects=False)
+            return response.status_code == 200 and 'image' in response.headers.get('content-type', '')
+        except Exception:
+            return False
+
+    def _probe_logo_urls(self, urls: List[str]) -> Optional[bytes]:
+        """HEAD-probe candidate logo URLs in parallel, then GET only the winner.
+
+        The probes race, but the pick keeps the candidate order (.com first)
+        so a faster .org response can't swap in another company's logo.
+        """
+        futures = {self._executor.submit(self._head_image_url, u): idx for idx, u in enumerate(urls)}
+        best = len(urls)
+        for future in as_completed(futures):
+            idx = futures[future]
+            if future.result() and idx < best:
+                best = idx
+                if best == 0:
+                    break
+        if best == len(urls):
+            return None
+        return self._fetch_image_bytes(urls[best])
+
+    def _prefetch_images(self, urls: List[str]) -> Dict[str, Optional[bytes]]:
+        """Download a batch of image URLs concurrently; returns url -> bytes (None on miss)"""
+        futures = {
+            self._executor.submit(self._fetch_image_bytes, url): url
+            for url in dict.fromkeys(urls)
+        }
+        results: Dict[str, Optional[bytes]] = {}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+        return results
+
+    def _prefetch_all_logos(self, names: List[str], cert_domains: Optional[List[str]] = None):
+        """Warm the logo caches for a whole slide in one concurrent batch.
+
+        Fires every HEAD probe for every uncached name at once through the
+        shared thread pool, then downloads only the winning URL per name, so
+        layout afterwards runs entirely on hot cache. (The generator is
+        synchronous, so the pooled session + thread pool stands in for an
+        asyncio/aiohttp variant.)
+        """
+        tlds = [".com", ".in", ".co.in", ".net", ".org"]
+        pending = {}
+        for name in names:
+            clean_name = self._SUFFIX_RE.sub("", name.lower().strip()).strip().replace(" ", "")
+            if not clean_name or len(clean_name) < 2 or clean_name in self.logo_cache:
+                continue
+            if self._miss_bloom is not None and clean_name in self._miss_bloom:
+                continue
+            pending[clean_name] = [f"https://logo.clearbit.com/{clean_name}{tld}" for tld in tlds]
+
+        try:
+            if pending:
+                futures = {
+                    self._executor.submit(self._head_image_url, url): (clean, idx)
+                    for clean, urls in pending.items()
+                    for idx, url in enumerate(urls)
+                }
+                winners = {}
+                for future in as_completed(futures):
+                    clean, idx = futures[future]
+                    if future.result() and idx < winners.get(clean, len(tlds)):
+                        winners[clean] = idx
+
+                fetches = {
+                    self._executor.submit(self._fetch_image_bytes, pending[clean][idx]): clean
+                    for clean, idx in winners.items()
+                }
+                for future in as_completed(fetches):
+                    clean = fetches[future]
+                    content = future.result()
+                    if content:
+                        self.logo_cache[clean] = self._store_logo_bytes(clean, content)
+
+            if cert_domains:
+                wanted = [d for d in dict.fromkeys(cert_domains) if d not in self._cert_prefetch]
+                fetched = self._prefetch_images([f"https://logo.clearbit.com/{d}" for d in wanted])
+                for domain in wanted:
+                    self._cert_prefetch[domain] = fetched.get(f"https://logo.clearbit.com/{domain}")
+        except Exception as e:
+            print(f"[PPTGenerator] Logo prefetch failed: {e}")
+
     def _try_add_logo(self, slide, company_name: str, x: float, y: float, w: float, h: float) -> bool:
         """Try to add a company logo using Clearbit Logo API with multiple domain variations"""
         try:
-            # Clean company name
+            # Clean company name: strip business suffixes in one regex pass
             raw_name = company_name.lower().strip()
-            clean_name = raw_name
-            # Remove common business suffixes to get the core name
-            suffixes = [
-                " ltd", " limited", " pvt", " private", " inc", " corp", " llc", " llp", " co",
-                " solutions", " technologies", " systems", " services", " group", " holdings"
-            ]
-            for suffix in suffixes:
-                clean_name = clean_name.replace(suffix, "")
-            clean_name = clean_name.strip().replace(" ", "")
+            clean_name = self._SUFFIX_RE.sub("", raw_name).strip().replace(" ", "")
             
             if not clean_name or len(clean_name) < 2:
                 return self._add_letter_logo(slide, raw_name, x, y, w, h)
@@ -626,34 +1088,28 @@ class PPTGenerator:
             if clean_name in self.logo_cache:
                 img_path = self.logo_cache[clean_name]
                 if img_path and os.path.exists(img_path):
-                    slide.shapes.add_picture(img_path, Inches(x), Inches(y), Inches(w), Inches(h))
+                    slide.shapes.add_picture(img_path, _emu(x), _emu(y), _emu(w), _emu(h))
                     return True
                 if img_path is None: # Known failure
                      return self._add_letter_logo(slide, raw_name, x, y, w, h)
-            
-            # Try multiple TLDs
+
+            # Bloom filter remembers misses across runs without a network round trip
+            if self._miss_bloom is not None and clean_name in self._miss_bloom:
+                return self._add_letter_logo(slide, raw_name, x, y, w, h)
+
+            # Probe all TLD variations concurrently; first image hit wins
             tlds = [".com", ".in", ".co.in", ".net", ".org"]
-            for tld in tlds:
-                logo_url = f"https://logo.clearbit.com/{clean_name}{tld}"
-                try:
-                    response = requests.get(logo_url, timeout=3)
-                    if response.status_code == 200 and 'image' in response.headers.get('content-type', ''):
-                        # Save to temp file
-                        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-                        temp_file.write(response.content)
-                        temp_file.close()
-                        self.temp_images.append(temp_file.name)
-                        self.logo_cache[clean_name] = temp_file.name
-                        
-                        # Add to slide
-                        slide.shapes.add_picture(temp_file.name, Inches(x), Inches(y), Inches(w), Inches(h))
-                        print(f"[PPTGenerator] Added logo for: {company_name} using {tld}")
-                        return True
-                except:
-                    continue
+            logo_urls = [f"https://logo.clearbit.com/{clean_name}{tld}" for tld in tlds]
+            content = self._probe_logo_urls(logo_urls)
+            if content:
+                # Render straight from memory; persist separately for future runs
+                slide.shapes.add_picture(io.BytesIO(content), _emu(x), _emu(y), _emu(w), _emu(h))
+                self.logo_cache[clean_name] = self._store_logo_bytes(clean_name, content)
+                print(f"[PPTGenerator] Added logo for: {company_name}")
+                return True
             
             # --- PHASE 4: WIKIPEDIA & GOOGLE SEARCH logo discovery ---
-            if ScraperService and google_search:
+            if BeautifulSoup and google_search:
                 try:
                     # Search specifically for Wikipedia or high-res logos
                     q = f"{company_name} logo site:wikipedia.org OR site:wikimedia.org"
@@ -661,23 +1117,21 @@ class PPTGenerator:
                     for url in results:
                         # Try to find an image file on the page or use the page to find the official logo
                         if "wikipedia.org" in url or "wikimedia.org" in url:
-                            resp = requests.get(url, timeout=5)
+                            resp = self.session.get(url, timeout=5)
                             if resp.status_code == 200:
-                                soup = BeautifulSoup(resp.text, 'html.parser')
+                                # Only the infobox table is read; skip the rest of the page
+                                soup = BeautifulSoup(resp.text, _BS_PARSER, parse_only=_INFOBOX_STRAINER)
                                 # Look for the main logo in the infobox
                                 infobox = soup.find('table', class_='infobox')
                                 if infobox:
                                     img = infobox.find('img')
                                     if img and img.get('src'):
                                         img_url = "https:" + img['src'] if img['src'].startswith("//") else img['src']
-                                        # download and add
-                                        img_resp = requests.get(img_url, timeout=5)
-                                        if img_resp.status_code == 200:
-                                            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-                                            temp_file.write(img_resp.content)
-                                            temp_file.close()
-                                            self.temp_images.append(temp_file.name)
-                                            slide.shapes.add_picture(temp_file.name, Inches(x), Inches(y), Inches(w), Inches(h))
+                                        # download and add (size-capped stream)
+                                        img_bytes = self._fetch_image_bytes(img_url, timeout=5)
+                                        if img_bytes:
+                                            slide.shapes.add_picture(io.BytesIO(img_bytes), _emu(x), _emu(y), _emu(w), _emu(h))
+                                            self.logo_cache[clean_name] = self._store_logo_bytes(clean_name, img_bytes)
                                             print(f"[PPTGenerator] Added logo for: {company_name} from Wikipedia")
                                             return True
                 except Exception as e:
@@ -685,6 +1139,8 @@ class PPTGenerator:
 
             # Cache failed attempt
             self.logo_cache[clean_name] = None
+            if self._miss_bloom is not None:
+                self._miss_bloom.add(clean_name)
             return self._add_letter_logo(slide, raw_name, x, y, w, h)
             
         except Exception as e:
@@ -700,71 +1156,62 @@ class PPTGenerator:
             bx = x + (w - badge_size) / 2
             by = y + (h - badge_size) / 2
             
-            badge = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(bx), Inches(by), Inches(badge_size), Inches(badge_size))
+            badge = slide.shapes.add_shape(MSO_SHAPE.OVAL, _emu(bx), _emu(by), _emu(badge_size), _emu(badge_size))
             badge.fill.solid()
             badge.fill.fore_color.rgb = self.NAVY
             badge.line.color.rgb = self.LIGHT_TEAL
             badge.line.width = Pt(1)
-            
-            # Letter text
-            self._add_text(slide, bx, by + (badge_size * 0.15), badge_size, badge_size * 0.7, letter, 18, self.WHITE, bold=True, center=True)
+
+            # Letter text lives in the badge's own frame
+            self._add_text_in_shape(badge, letter, 18, self.WHITE, bold=True, center=True)
             return True
         except:
             return False
     
+    @staticmethod
+    def _resolve_cert_domain(cert_name: str) -> Optional[str]:
+        """Map a certification name to its issuing body's domain"""
+        name = cert_name.upper().strip()
+
+        # Exact hit covers the common case in one dict lookup
+        domain = _CERT_DOMAINS.get(name)
+        if domain:
+            return domain
+
+        # Known key appearing inside a longer name: single scan of one regex
+        m = _CERT_SUB_RE.search(name)
+        if m:
+            return _CERT_DOMAINS[m.group(0)]
+
+        # Rare inverse case: the given name is a fragment of a known key
+        return next((v for k, v in _CERT_DOMAINS.items() if name in k), None)
+
     def _try_add_cert_icon(self, slide, cert_name: str, x: float, y: float, w: float, h: float) -> bool:
         """Try to add a certification icon using a predefined domain mapping"""
-        cert_domains = {
-            "ISO 9001": "iso.org",
-            "ISO 14001": "iso.org",
-            "ISO 22000": "iso.org",
-            "ISO 27001": "iso.org",
-            "WHO-GMP": "who.int",
-            "FDA": "fda.gov",
-            "FSSAI": "fssai.gov.in",
-            "HACCP": "haccp.com",
-            "BRC": "brcgs.com",
-            "IATF 16949": "iatfglobaloversight.org",
-            "OHSAS 18001": "iso.org",
-            "REACH": "echa.europa.eu",
-            "GDPR": "gdpr.eu",
-            "SOC 2": "aicpa.org",
-            "SEDEX": "sedex.com",
-            "SA 8000": "sa-intl.org"
-        }
-        
-        # Direct match or partial match
-        name = cert_name.upper().strip()
-        domain = None
-        for key, val in cert_domains.items():
-            if key in name or name in key:
-                domain = val
-                break
-        
+        domain = self._resolve_cert_domain(cert_name)
         if not domain:
             return False
-            
+
         try:
-            logo_url = f"https://logo.clearbit.com/{domain}"
-            response = requests.get(logo_url, timeout=3)
-            if response.status_code == 200 and 'image' in response.headers.get('content-type', ''):
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-                temp_file.write(response.content)
-                temp_file.close()
-                self.temp_images.append(temp_file.name)
-                slide.shapes.add_picture(temp_file.name, Inches(x), Inches(y), Inches(w), Inches(h))
+            # Cert icons are fixed per domain; serve from the persistent cache
+            # (entries live outside temp_images, so per-run cleanup skips them)
+            cache_key = f"cert:{domain}"
+            cached_path = self.logo_cache.get(cache_key)
+            if cached_path and os.path.exists(cached_path):
+                slide.shapes.add_picture(cached_path, _emu(x), _emu(y), _emu(w), _emu(h))
+                return True
+
+            content = self._cert_prefetch.get(domain)
+            if content is None and domain not in self._cert_prefetch:
+                content = self._fetch_image_bytes(f"https://logo.clearbit.com/{domain}")
+            if content:
+                self.logo_cache[cache_key] = self._store_logo_bytes(f"cert-{domain}", content)
+                # add_picture takes a file-like; no temp file round-trip needed
+                bio = io.BytesIO(content)
+                self._image_buffers.append(bio)
+                slide.shapes.add_picture(bio, _emu(x), _emu(y), _emu(w), _emu(h))
                 return True
         except:
             pass
-            
+
         return False
-    
-    def _cleanup_temp_images(self):
-        """Clean up temporary image files"""
-        for temp_path in self.temp_images:
-            try:
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-            except:
-                pass
-        self.temp_images = []
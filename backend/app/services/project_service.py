@@ -1,4 +1,5 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
 from app.db import models
 from app.schemas import ProjectCreate
 
@@ -14,14 +15,21 @@ def create_project(db: Session, project_in: ProjectCreate, user_id: int):
     return db_project
 
 def get_projects(db: Session, user_id: int, skip: int = 0, limit: int = 100):
-    return db.query(models.Project)\
-        .options(joinedload(models.Project.files), joinedload(models.Project.artifacts))\
-        .filter(models.Project.owner_id == user_id)\
-        .offset(skip).limit(limit).all()
+    # 2.0-style select benefits from SQLAlchemy's compiled statement cache;
+    # selectinload fetches each collection with one IN query instead of the
+    # cartesian row set joinedload produces for two collections
+    stmt = (
+        select(models.Project)
+        .options(selectinload(models.Project.files), selectinload(models.Project.artifacts))
+        .where(models.Project.owner_id == user_id)
+        .order_by(models.Project.id)
+        .offset(skip).limit(limit)
+    )
+    return db.execute(stmt).scalars().unique().all()
 
 def get_project(db: Session, project_id: int, user_id: int):
     return db.query(models.Project)\
-        .options(joinedload(models.Project.files), joinedload(models.Project.artifacts))\
+        .options(selectinload(models.Project.files), selectinload(models.Project.artifacts))\
         .filter(models.Project.id == project_id, models.Project.owner_id == user_id)\
         .first()
 
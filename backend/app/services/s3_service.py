@@ -1,6 +1,4 @@
 import os
-import boto3
-from botocore.exceptions import ClientError
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -15,11 +13,21 @@ class S3Service:
             os.makedirs(self.local_storage_path, exist_ok=True)
             print(f"Using local storage at: {self.local_storage_path}")
         else:
+            # boto3 costs ~300 ms to import; only pay it when S3 is in play
+            import boto3
+            from boto3.s3.transfer import TransferConfig
+
             self.endpoint_url = os.getenv("S3_ENDPOINT")
             self.access_key = os.getenv("S3_ACCESS_KEY")
             self.secret_key = os.getenv("S3_SECRET_KEY")
             self.bucket_name = os.getenv("S3_BUCKET", "kelp-teasers")
-            
+
+            # Concurrent multipart transfer above 8 MB; small artifacts go up in one part
+            self._transfer_config = TransferConfig(
+                multipart_threshold=8 * 1024 * 1024,
+                max_concurrency=10,
+                use_threads=True
+            )
             self.s3_client = boto3.client(
                 's3',
                 endpoint_url=self.endpoint_url,
@@ -32,6 +40,7 @@ class S3Service:
     def _ensure_bucket_exists(self):
         if self.use_local_storage:
             return
+        from botocore.exceptions import ClientError
         try:
             self.s3_client.head_bucket(Bucket=self.bucket_name)
         except ClientError as e:
@@ -47,6 +56,20 @@ class S3Service:
             else:
                 print(f"Error checking bucket: {e}")
 
+    @staticmethod
+    def _local_copy(src: str, dest: str):
+        """Hardlink when on the same filesystem, else copyfile (sendfile on Linux)"""
+        # unlink + catch saves the stat an exists() check would cost
+        try:
+            os.unlink(dest)
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(src, dest)
+        except OSError:
+            import shutil
+            shutil.copyfile(src, dest)
+
     def upload_file(self, local_path: str, s3_key: str) -> Optional[str]:
         """
         Uploads a file to S3 and returns the version ID.
@@ -55,17 +78,18 @@ class S3Service:
             if self.use_local_storage:
                 dest_path = os.path.join(self.local_storage_path, s3_key)
                 os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                import shutil
-                shutil.copy2(local_path, dest_path)
+                self._local_copy(local_path, dest_path)
                 return "v1" # Dummy version ID for local storage
 
-            with open(local_path, 'rb') as f:
-                response = self.s3_client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=s3_key,
-                    Body=f
-                )
-            return response.get('VersionId')
+            # Streamed multipart upload instead of a single put_object blob
+            self.s3_client.upload_file(
+                local_path,
+                self.bucket_name,
+                s3_key,
+                Config=self._transfer_config
+            )
+            head = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+            return head.get('VersionId')
         except Exception as e:
             print(f"Upload Error: {e}")
             return None
@@ -78,8 +102,7 @@ class S3Service:
             if self.use_local_storage:
                 source_path = os.path.join(self.local_storage_path, s3_key)
                 if os.path.exists(source_path):
-                    import shutil
-                    shutil.copy2(source_path, local_path)
+                    self._local_copy(source_path, local_path)
                     return True
                 return False
 
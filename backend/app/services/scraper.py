@@ -1,35 +1,133 @@
 import os
+import asyncio
+import functools
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 from typing import Dict, Any, List, Optional, Tuple
 
+google_search = None
+_gs_loaded = False
+
+
+def _gs():
+    """Import googlesearch on first use; it drags in bs4 and slows cold start."""
+    global google_search, _gs_loaded
+    if not _gs_loaded:
+        _gs_loaded = True
+        try:
+            from googlesearch import search
+            google_search = search
+        except Exception:
+            google_search = None
+    return google_search
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# uvloop's event loop is ~2x faster than asyncio's default on Linux; purely
+# optional, everything works on the stock loop
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# lxml's C parser is several times faster than the pure-Python default
 try:
-    from googlesearch import search as google_search
+    import lxml  # noqa: F401
+    _BS_PARSER = 'lxml'
+except ImportError:
+    _BS_PARSER = 'html.parser'
+
+_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
+
+# Shared pooled session: keep-alive avoids a fresh TCP+TLS handshake per request
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=Retry(total=2, backoff_factor=0.3))
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+
+# Only these tags are ever read from scraped pages; skip building the rest of the DOM
+_PAGE_STRAINER = SoupStrainer(['title', 'meta', 'p'])
+
+# Optional cross-process TTL cache for the slow Google-backed lookups
+try:
+    from diskcache import Cache as _DiskCache
+    _SCRAPE_CACHE = _DiskCache('data/scrape_cache')
 except Exception:
-    google_search = None
+    _SCRAPE_CACHE = None
 
 class ScraperService:
     @staticmethod
     def _get_serpapi_key():
         return os.getenv("SERPAPI_KEY")
 
+    @staticmethod
+    def _search_links(query: str, num: int) -> List[str]:
+        """
+        Web search returning result links. Prefers SerpAPI's JSON endpoint
+        (one API call) over the googlesearch HTML scrape when a key is set.
+        """
+        api_key = ScraperService._get_serpapi_key()
+        if api_key:
+            try:
+                params = {"q": query, "api_key": api_key, "num": num}
+                response = _SESSION.get("https://serpapi.com/search", params=params, timeout=10)
+                if response.status_code == 200:
+                    links = [r.get("link") for r in response.json().get("organic_results", [])]
+                    return [l for l in links if l][:num]
+            except Exception as e:
+                print(f"SerpAPI Error: {e}")
+
+        if _gs():
+            try:
+                return list(google_search(query, num_results=num, lang="en"))
+            except Exception:
+                pass
+        return []
+
     @staticmethod
     def find_official_site(company_name: str) -> Optional[str]:
         """
         Best-effort: find likely official website using search results.
+        Successful lookups are memoized in-process and on disk; misses and
+        errors are never cached, so a transient search failure can't pin a
+        None for the worker's lifetime.
         """
-        if not company_name or not google_search:
+        if not company_name:
             return None
         try:
-            q = f"{company_name} official website"
-            results = list(google_search(q, num_results=5, lang="en"))
-            for url in results:
-                if url.startswith("https://") and not any(bad in url for bad in ["linkedin.com", "facebook.com", "instagram.com", "twitter.com", "x.com", "wikipedia.org"]):
-                    return url
-            return results[0] if results else None
+            return ScraperService._find_official_site_cached(company_name)
         except Exception:
             return None
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _find_official_site_cached(company_name: str) -> str:
+        # Raises on miss/error so lru_cache only ever retains real hits
+        cache_key = f"official_site:{company_name.lower()}"
+        if _SCRAPE_CACHE is not None and cache_key in _SCRAPE_CACHE:
+            return _SCRAPE_CACHE[cache_key]
+
+        results = ScraperService._search_links(f"{company_name} official website", 5)
+        found = None
+        for url in results:
+            if url.startswith("https://") and not any(bad in url for bad in ["linkedin.com", "facebook.com", "instagram.com", "twitter.com", "x.com", "wikipedia.org"]):
+                found = url
+                break
+        if found is None:
+            found = results[0] if results else None
+        if found is None:
+            raise LookupError("no search results")
+        if _SCRAPE_CACHE is not None:
+            _SCRAPE_CACHE.set(cache_key, found, expire=86400)
+        return found
+
     @staticmethod
     def scrape_news_serpapi(company_name: str) -> List[Dict[str, Any]]:
         """
@@ -46,7 +144,7 @@ class ScraperService:
                 "api_key": api_key,
                 "num": 3
             }
-            response = requests.get("https://serpapi.com/search", params=params, timeout=10)
+            response = _SESSION.get("https://serpapi.com/search", params=params, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 news_results = data.get("news_results", [])
@@ -59,115 +157,180 @@ class ScraperService:
     def scrape_linkedin_public(company_name: str) -> Dict[str, Any]:
         """
         Improved best-effort LinkedIn discovery using Google Search.
+        Completed searches are memoized in-process and on disk; error
+        results are never cached, so one rate-limit or network blip can't
+        poison the company's lookup until the worker restarts.
         """
-        if not google_search:
+        if not ScraperService._get_serpapi_key() and not _gs():
             return {"platform": "LinkedIn", "error": "Google search not available"}
-            
         try:
-            q = f"{company_name} linkedin company page"
-            results = list(google_search(q, num_results=3, lang="en"))
-            target_url = None
-            for url in results:
-                if "linkedin.com/company/" in url:
-                    target_url = url
-                    break
-            
-            if target_url:
-                # In a real production environment, we would use a dedicated scrapers like Proxycurl
-                # For now, we return the URL and metadata for IntelligenceService to reference
-                return {
-                    "platform": "LinkedIn",
-                    "url": target_url,
-                    "note": f"Discovered company profile for context."
-                }
-            return {"platform": "LinkedIn", "note": "No public company profile found."}
+            return ScraperService._scrape_linkedin_cached(company_name)
         except Exception as e:
             return {"platform": "LinkedIn", "error": str(e)}
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _scrape_linkedin_cached(company_name: str) -> Dict[str, Any]:
+        # Raises on error so lru_cache only retains completed searches
+        cache_key = f"linkedin:{company_name.lower()}"
+        if _SCRAPE_CACHE is not None and cache_key in _SCRAPE_CACHE:
+            return _SCRAPE_CACHE[cache_key]
+
+        results = ScraperService._search_links(f"{company_name} linkedin company page", 3)
+        target_url = None
+        for url in results:
+            if "linkedin.com/company/" in url:
+                target_url = url
+                break
+
+        if target_url:
+            # In a real production environment, we would use a dedicated scrapers like Proxycurl
+            # For now, we return the URL and metadata for IntelligenceService to reference
+            result = {
+                "platform": "LinkedIn",
+                "url": target_url,
+                "note": f"Discovered company profile for context."
+            }
+        else:
+            result = {"platform": "LinkedIn", "note": "No public company profile found."}
+        if _SCRAPE_CACHE is not None:
+            _SCRAPE_CACHE.set(cache_key, result, expire=86400)
+        return result
+
     @staticmethod
     def gather_public_context(company_name: str, website: Optional[str] = None, max_urls: int = 5) -> Dict[str, Any]:
         """
         Collects comprehensive public context.
         """
-        urls: List[str] = []
+        candidate_urls: List[str] = []
         if website:
-            urls.append(website if website.startswith("http") else "https://" + website)
+            candidate_urls.append(website if website.startswith("http") else "https://" + website)
         else:
             found = ScraperService.find_official_site(company_name)
             if found:
-                urls.append(found)
+                candidate_urls.append(found)
 
         # 1. Basic Web Search
-        if google_search:
+        try:
+            q = f"{company_name} products business model"
+            candidate_urls.extend(u for u in ScraperService._search_links(q, max_urls) if u.startswith("http"))
+        except Exception:
+            pass
+
+        # Ordered dedup in one pass instead of O(N) membership checks per insert
+        urls = list(dict.fromkeys(candidate_urls))[:max_urls]
+
+        # 2+3. Page downloads, SerpAPI news and LinkedIn discovery are all
+        # latency-bound; run them in one concurrent batch when aiohttp is there
+        urls_to_fetch = urls
+        page_infos = None
+        if aiohttp:
             try:
-                q = f"{company_name} products business model"
-                for u in google_search(q, num_results=max_urls, lang="en"):
-                    if u not in urls and u.startswith("http"):
-                        urls.append(u)
-                    if len(urls) >= max_urls:
-                        break
-            except Exception:
-                pass
+                page_infos, news, linkedin = asyncio.run(
+                    ScraperService._gather_context_async(company_name, urls_to_fetch)
+                )
+            except Exception as e:
+                print(f"Async scrape failed, falling back to sequential: {e}")
+                page_infos = None
 
-        # 2. News from SerpAPI
-        news = ScraperService.scrape_news_serpapi(company_name)
-        
-        # 3. LinkedIn Context
-        linkedin = ScraperService.scrape_linkedin_public(company_name)
+        if page_infos is None:
+            news = ScraperService.scrape_news_serpapi(company_name)
+            linkedin = ScraperService.scrape_linkedin_public(company_name)
+            page_infos = [ScraperService.scrape_website(u) for u in urls_to_fetch]
 
         scraped_pages: List[Dict[str, Any]] = []
-        combined_text = ""
-        for u in urls[:max_urls]:
-            info = ScraperService.scrape_website(u)
+        parts: List[str] = []
+        for u, info in zip(urls_to_fetch, page_infos):
             if info and not info.get("error"):
                 scraped_pages.append({"url": u, **info})
-                combined_text += f"\nURL: {u}\nTITLE: {info.get('title','')}\nTEXT: {info.get('content_snippet','')}\n"
+                parts.append(f"\nURL: {u}\nTITLE: {info.get('title','')}\nTEXT: {info.get('content_snippet','')}\n")
 
         # Add news to combined text
         for n in news:
-            combined_text += f"\nNEWS: {n['title']} - {n['snippet']} (Source: {n['link']})\n"
+            parts.append(f"\nNEWS: {n['title']} - {n['snippet']} (Source: {n['link']})\n")
 
         # Add LinkedIn context
         if linkedin.get("url"):
-            combined_text += f"\nLINKEDIN: {linkedin['url']} - {linkedin.get('note','')}\n"
+            parts.append(f"\nLINKEDIN: {linkedin['url']} - {linkedin.get('note','')}\n")
 
         return {
-            "urls": urls[:max_urls],
+            "urls": urls,
             "pages": scraped_pages,
             "news": news,
             "linkedin": linkedin,
-            "combined_text": combined_text.strip()
+            "combined_text": "".join(parts).strip()
         }
 
+    @staticmethod
+    def _parse_page(html: str) -> Dict[str, Any]:
+        """
+        Extracts title/description/snippet from raw page HTML.
+        """
+        soup = BeautifulSoup(html, _BS_PARSER, parse_only=_PAGE_STRAINER)
+        title = soup.title.string.strip() if soup.title else ""
+        desc = ""
+        meta = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
+        if meta:
+            desc = meta.get('content', '').strip()
+        paragraphs = [p.get_text().strip() for p in soup.find_all('p') if len(p.get_text()) > 50]
+        full_text = " ".join(paragraphs[:5])
+        return {"title": title, "description": desc, "content_snippet": full_text}
+
+    @staticmethod
+    async def _scrape_website_async(session, url: str) -> Dict[str, Any]:
+        """
+        Async variant of scrape_website sharing one aiohttp session.
+        """
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status != 200:
+                    return {"error": f"Status {resp.status}"}
+                html = await resp.text()
+            # Parse off the event loop so it overlaps with in-flight fetches
+            return await asyncio.to_thread(ScraperService._parse_page, html)
+        except Exception as e:
+            return {"error": str(e)}
+
+    @staticmethod
+    async def _gather_context_async(company_name: str, urls: List[str]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Runs all page downloads plus the news and LinkedIn lookups concurrently.
+        """
+        # Cap concurrent connections so a burst of URLs can't exhaust sockets
+        connector = aiohttp.TCPConnector(limit=10)
+        async with aiohttp.ClientSession(headers=_HEADERS, connector=connector) as session:
+            results = await asyncio.gather(
+                *(ScraperService._scrape_website_async(session, u) for u in urls),
+                asyncio.to_thread(ScraperService.scrape_news_serpapi, company_name),
+                asyncio.to_thread(ScraperService.scrape_linkedin_public, company_name),
+                return_exceptions=True
+            )
+
+        pages = [r if isinstance(r, dict) else {"error": str(r)} for r in results[:len(urls)]]
+        news = results[-2] if isinstance(results[-2], list) else []
+        linkedin = results[-1] if isinstance(results[-1], dict) else {"platform": "LinkedIn", "error": str(results[-1])}
+        return pages, news, linkedin
+
     @staticmethod
     def scrape_website(url: str) -> Dict[str, Any]:
         """
-        Fetches public company info from the URL. 
+        Fetches public company info from the URL.
         Uses requests/BS4 by default, with an optional Playwright fallback.
         """
         if not url:
             return {}
         if not url.startswith('http'):
             url = 'https://' + url
-            
+
         try:
             # Try Requests first (faster)
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-            response = requests.get(url, headers=headers, timeout=10)
-            
+            response = _SESSION.get(url, timeout=10)
+
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                title = soup.title.string.strip() if soup.title else ""
-                desc = ""
-                meta = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
-                if meta:
-                    desc = meta.get('content', '').strip()
-                paragraphs = [p.get_text().strip() for p in soup.find_all('p') if len(p.get_text()) > 50]
-                full_text = " ".join(paragraphs[:5])
-                return {"title": title, "description": desc, "content_snippet": full_text}
-            
+                return ScraperService._parse_page(response.text)
+
             # If requests fails or returns 403, Playwright could be used here in Docker
             return {"error": f"Status {response.status_code}"}
-            
+
         except Exception as e:
             return {"error": str(e)}
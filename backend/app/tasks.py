@@ -1,6 +1,9 @@
 """
 Celery Tasks - Enhanced Project Processing
-Integrates all services for comprehensive teaser generation
+The pipeline is split into four stage tasks (parse -> enrich -> generate ->
+upload) chained through the broker so a worker slot is only held for one
+stage at a time; process_project_task remains as the single-process entry
+point used by the direct/background-task path.
 """
 
 from app.core.celery_app import celery_app
@@ -9,168 +12,385 @@ from app.services.ppt_generator import PPTGenerator
 from app.services.parser import DataParser, DocumentExtractor
 from app.services.scraper import ScraperService
 from app.services.image_service import ImageService
+from app.services import narrative_cache
 from app.db.database import SessionLocal
 from app.db import models
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import selectinload
+from celery import chain
+from celery.signals import celeryd_init, worker_process_init
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, is_dataclass
+from logging.handlers import QueueHandler, QueueListener
+import logging
 import os
-import traceback
+import queue
+import sys
+from pathlib import Path
 
+# Log records go through an in-memory queue drained by a single background
+# listener, so task threads never block on the worker's captured stdout pipe
+logger = logging.getLogger("tasks")
+_log_queue = queue.Queue(-1)
+logger.addHandler(QueueHandler(_log_queue))
+logger.setLevel(logging.INFO)
+# Celery hijacks the root logger; without this every record would also be
+# written synchronously by the root handler on the task thread (and emitted
+# twice)
+logger.propagate = False
+_log_listener = None
 
-@celery_app.task(name="app.tasks.process_project_task", bind=True, max_retries=2)
-def process_project_task(self=None, project_id: int = None):
+# Last-resort financials when parser, extractor and AI all came up empty;
+# module scope avoids re-allocating the dict per task
+DEFAULT_FIN = {
+    "years": ["FY21", "FY22", "FY23", "FY24"],
+    "revenue": [100, 125, 160, 200],
+    "ebitda": [15, 20, 28, 38],
+    "pat": [8, 12, 18, 25]
+}
+
+
+def _start_log_listener():
+    global _log_listener
+    if _log_listener is None:
+        # The real stderr: Celery redirects sys.stdout/stderr into logging,
+        # and writing there would loop records back through the root logger
+        handler = logging.StreamHandler(sys.__stderr__)
+        handler.setFormatter(logging.Formatter("%(asctime)s [%(name)s] %(message)s"))
+        _log_listener = QueueListener(_log_queue, handler)
+        _log_listener.start()
+
+
+@celeryd_init.connect
+def _start_parent_log_listener(**kwargs):
+    # Covers the worker parent and the solo/threads pools
+    _start_log_listener()
+
+
+@worker_process_init.connect
+def _restart_log_listener(**kwargs):
+    # Prefork children inherit the parent's listener object but not its
+    # thread; drop it and start a fresh one post-fork or every record would
+    # sit in a queue nothing drains
+    global _log_listener
+    _log_listener = None
+    _start_log_listener()
+
+
+@worker_process_init.connect
+def _warm_clients(**kwargs):
+    """
+    Build the heavyweight service singletons in each prefork child before its
+    first task, so no project pays the client construction + TLS handshake
+    (~100ms each) on the hot path.
+    """
+    try:
+        from app.services.openai_service import get_openai_service
+        get_openai_service()
+    except Exception as e:
+        logger.info("[Task] OpenAI client warmup skipped - %s", e)
+    try:
+        from app.services.s3_service import get_s3_service
+        get_s3_service()
+    except Exception as e:
+        logger.info("[Task] S3 client warmup skipped - %s", e)
+
+
+def _ensure_logging():
+    if _log_listener is None:
+        # Running outside a Celery worker (tests, eager mode): start the
+        # listener here so queued records still reach stdout
+        _start_log_listener()
+
+
+def _json_safe_financials(fin: dict) -> dict:
     """
-    Enhanced project processing with comprehensive data extraction and generation.
+    Kombu's JSON serializer can't encode the DataSource instances the parsers
+    leave under source_metadata; flatten them before the state crosses the
+    broker. Cache-hit parses already return plain dicts, hence the guard.
     """
-    print(f"[Task] ========== Starting Project {project_id} ==========")
+    meta = fin.get("source_metadata")
+    if meta:
+        fin = dict(fin)
+        fin["source_metadata"] = {
+            k: (asdict(v) if is_dataclass(v) else v) for k, v in meta.items()
+        }
+    return fin
+
+
+def _mark_failed(project_id: int):
+    """Best-effort flip of the project row to FAILED"""
+    try:
+        db = SessionLocal()
+        try:
+            project = db.get(models.Project, project_id)
+            if project:
+                project.status = models.ProjectStatus.FAILED
+                db.commit()
+        finally:
+            db.close()
+    except SQLAlchemyError as e:
+        logger.info("[Task] Project %s: could not record FAILED status - %s", project_id, e)
+
+
+# ========================================================================
+# Pipeline stages. Each takes and returns a JSON-serializable state dict so
+# the Celery chain can pass it between workers on different queues.
+# ========================================================================
+
+def _parse_stage(state: dict) -> dict:
+    """Stage 1: flip status, parse uploaded files (I/O bound)"""
+    project_id = state["project_id"]
+    logger.info("[Task] ========== Starting Project %s ==========", project_id)
     db = SessionLocal()
-    
+    pool = ThreadPoolExecutor(max_workers=8)
+
     try:
-        # Get project
-        project = db.query(models.Project).filter(models.Project.id == project_id).first()
+        # Get project with files eager-loaded; Session.get skips the query
+        # builder and the selectinload saves the lazy-load SELECT later
+        project = db.get(
+            models.Project, project_id,
+            options=[selectinload(models.Project.files)]
+        )
         if not project:
-            print(f"[Task] Project {project_id} not found")
-            return
-        
-        # Update status
+            logger.info("[Task] Project %s not found", project_id)
+            state["aborted"] = True
+            return state
+
+        # Update status; its own commit because the UI polls for PROCESSING
         project.status = models.ProjectStatus.PROCESSING
         db.commit()
-        db.refresh(project)
-        print(f"[Task] Project {project_id}: Status -> PROCESSING")
-        
-        # ========== 1. PARSE FILES ==========
-        print(f"[Task] Project {project_id}: Parsing {len(project.files)} files...")
-        
-        aggregated_text = ""
+        logger.info("[Task] Project %s: Status -> PROCESSING", project_id)
+
+        state["company_name"] = project.company_name
+        state["company_url"] = project.company_url
+
+        # On the in-process path the scrape future rides in the state dict
+        # (it never crosses a broker there), so the network wait overlaps
+        # file parsing just like before the stage split. On the chain path
+        # the enrich stage scrapes synchronously instead.
+        if state.pop("_inline", False) and project.company_name:
+            state["_scrape_future"] = pool.submit(
+                ScraperService.gather_public_context,
+                project.company_name,
+                website=project.company_url,
+                max_urls=3
+            )
+
+        logger.info("[Task] Project %s: Parsing %s files...", project_id, len(project.files))
+
+        # List accumulator + single join: repeated += on large multi-PDF
+        # projects is quadratic
+        text_parts = []
         excel_data = {}
         pdf_kpis = {}
-        
-        for f in project.files:
+
+        def _parse_one(f):
+            if f.file_type == 'excel':
+                return DataParser.parse_excel(f.file_path)
+            if f.file_type == 'pdf':
+                return DataParser.parse_pdf(f.file_path)
+            return {}
+
+        # Parse files concurrently (parsers release the GIL in their C cores),
+        # then merge in upload order so precedence stays deterministic.
+        # Citation sources are built in the same pass so the relationship is
+        # iterated exactly once.
+        files = list(project.files)
+        state["sources"] = [
+            {"type": "file", "value": f.filename, "context": "Data Extraction"}
+            for f in files
+        ]
+        parsed_results = []
+        futures = [pool.submit(_parse_one, f) for f in files]
+        for f, future in zip(files, futures):
+            try:
+                parsed_results.append((f, future.result()))
+            except Exception as e:
+                logger.info("[Task] Project %s: File parse error - %s", project_id, e)
+                parsed_results.append((f, {}))
+
+        for f, parsed in parsed_results:
             try:
                 if f.file_type == 'excel':
-                    parsed = DataParser.parse_excel(f.file_path)
                     if parsed.get('financials') and parsed['financials'].get('revenue'):
                         excel_data = parsed['financials']
-                        print(f"[Task] Project {project_id}: Excel financials extracted")
-                        print(f"       Years: {excel_data.get('years')}")
-                        print(f"       Revenue: {excel_data.get('revenue')}")
-                        
+                        logger.info("[Task] Project %s: Excel financials extracted", project_id)
+                        logger.info("       Years: %s", excel_data.get('years'))
+                        logger.info("       Revenue: %s", excel_data.get('revenue'))
+
                 elif f.file_type == 'pdf':
-                    parsed = DataParser.parse_pdf(f.file_path)
                     content = parsed.get('text_content', "")
                     if content:
-                        aggregated_text += content + "\n"
-                        print(f"[Task] Project {project_id}: PDF text extracted ({len(content)} chars)")
-                    
+                        text_parts.append(content)
+                        logger.info("[Task] Project %s: PDF text extracted (%s chars)", project_id, len(content))
+
                     # Merge KPIs
                     kpis = parsed.get('kpis', {})
                     pdf_kpis.update({k: v for k, v in kpis.items() if v})
-                    
+
                     # Check for PDF tables
                     if parsed.get('financials') and not excel_data:
                         excel_data = parsed['financials']
-                        print(f"[Task] Project {project_id}: PDF table financials extracted")
-                        
-            except Exception as e:
-                print(f"[Task] Project {project_id}: File parse error - {e}")
-        
-        # ========== 2. SCRAPE PUBLIC DATA ==========
-        print(f"[Task] Project {project_id}: Gathering public context...")
-        scraped_text = ""
-        company_name = project.company_name
-        
-        if company_name:
-            try:
-                public_context = ScraperService.gather_public_context(
-                    company_name, 
-                    website=project.company_url,
-                    max_urls=3
-                )
-                scraped_text = public_context.get("combined_text", "")
-                if scraped_text:
-                    aggregated_text += "\n" + scraped_text
-                    print(f"[Task] Project {project_id}: Scraped {len(scraped_text)} chars")
+                        logger.info("[Task] Project %s: PDF table financials extracted", project_id)
+
             except Exception as e:
-                print(f"[Task] Project {project_id}: Scraping error - {e}")
-        
-        # ========== 3. DETECT SECTOR ==========
-        detection_text = aggregated_text or company_name or ""
-        sector = IntelligenceService.detect_sector(detection_text)
-        print(f"[Task] Project {project_id}: Detected Sector -> {sector}")
-        
-        # ========== 4. EXTRACT NARRATIVE FROM PDF ==========
-        print(f"[Task] Project {project_id}: Extracting narrative from uploaded files...")
-        extracted_narrative = {}
-        if aggregated_text:
-            extracted_narrative = DocumentExtractor.extract_narrative(aggregated_text)
-            extracted_fields = extracted_narrative.get("_extracted_fields", [])
-            print(f"[Task] Project {project_id}: Extracted {len(extracted_fields)} fields from PDF")
-        
-        # ========== 5. PREPARE FINANCIAL DATA ==========
-        # Check if we have real data from parsing
-        has_real_data = bool(excel_data.get("revenue"))
-        
+                logger.info("[Task] Project %s: File parse error - %s", project_id, e)
+
+        state["text_parts"] = text_parts
+        state["excel_data"] = _json_safe_financials(excel_data)
+        state["pdf_kpis"] = pdf_kpis
+        return state
+
+    finally:
+        pool.shutdown(wait=False)
+        db.close()
+
+
+def _enrich_stage(state: dict) -> dict:
+    """Stage 2: public-web scrape, sector detection, narrative extraction"""
+    if state.get("aborted"):
+        return state
+    project_id = state["project_id"]
+    company_name = state.get("company_name")
+    text_parts = state.get("text_parts", [])
+
+    logger.info("[Task] Project %s: Gathering public context...", project_id)
+    scrape_future = state.pop("_scrape_future", None)
+    public_context = None
+    try:
+        if scrape_future is not None:
+            public_context = scrape_future.result()
+        elif company_name:
+            public_context = ScraperService.gather_public_context(
+                company_name,
+                website=state.get("company_url"),
+                max_urls=3
+            )
+    except Exception as e:
+        logger.info("[Task] Project %s: Scraping error - %s", project_id, e)
+    if public_context:
+        scraped_text = public_context.get("combined_text", "")
+        if scraped_text:
+            text_parts.append(scraped_text)
+            logger.info("[Task] Project %s: Scraped %s chars", project_id, len(scraped_text))
+
+    aggregated_text = "\n".join(text_parts)
+    # Only the head of the text feeds the LLM; slice once and reuse
+    text_head = aggregated_text[:12000]
+
+    detection_text = aggregated_text or company_name or ""
+    sector = IntelligenceService.detect_sector(detection_text)
+    logger.info("[Task] Project %s: Detected Sector -> %s", project_id, sector)
+
+    logger.info("[Task] Project %s: Extracting narrative from uploaded files...", project_id)
+    extracted_narrative = {}
+    if aggregated_text:
+        extracted_narrative = DocumentExtractor.extract_narrative(aggregated_text)
+        extracted_fields = extracted_narrative.get("_extracted_fields", [])
+        logger.info("[Task] Project %s: Extracted %s fields from PDF", project_id, len(extracted_fields))
+
+    # Drop the full text before the state crosses the broker; downstream
+    # stages only need the head
+    state.pop("text_parts", None)
+    state["text_head"] = text_head
+    state["sector"] = sector
+    state["extracted_narrative"] = extracted_narrative
+    return state
+
+
+def _generate_stage(state: dict) -> dict:
+    """Stage 3: AI narrative, images, PPT and citation generation (CPU/LLM bound)"""
+    if state.get("aborted"):
+        return state
+    project_id = state["project_id"]
+    company_name = state.get("company_name")
+    sector = state.get("sector")
+    excel_data = state.get("excel_data") or {}
+    pdf_kpis = state.get("pdf_kpis") or {}
+    extracted_narrative = state.get("extracted_narrative") or {}
+    text_head = state.get("text_head", "")
+    pool = ThreadPoolExecutor(max_workers=4)
+
+    try:
+        # Image fetches are pure network I/O; overlap them with the LLM call
+        image_futures = [
+            pool.submit(ImageService.get_sector_image, sector, i)
+            for i in range(3)
+        ]
+
         # Initial financial data (either real or empty)
+        has_real_data = bool(excel_data.get("revenue"))
         financial_data = excel_data if has_real_data else {}
-        
-        # ========== 6. GENERATE AI NARRATIVE (fills gaps) ==========
-        print(f"[Task] Project {project_id}: Generating AI narrative for missing fields...")
-        ai_narrative = IntelligenceService.generate_narrative(
-            sector=sector,
-            financial_data=financial_data,
-            kpis=pdf_kpis,
-            scraped_text=aggregated_text[:12000] if aggregated_text else None
-        )
-        
-        # ========== 7. MERGE NARRATIVES (prefer extracted, fallback to AI) ==========
+
+        logger.info("[Task] Project %s: Generating AI narrative for missing fields...", project_id)
+        narrative_key = narrative_cache.make_key(sector, text_head, financial_data, pdf_kpis)
+        ai_narrative = narrative_cache.get(narrative_key)
+        if ai_narrative:
+            logger.info("[Task] Project %s: Narrative cache hit, skipping LLM call", project_id)
+        else:
+            ai_narrative = IntelligenceService.generate_narrative(
+                sector=sector,
+                financial_data=financial_data,
+                kpis=pdf_kpis,
+                scraped_text=text_head or None
+            )
+            narrative_cache.put(narrative_key, ai_narrative)
+
+        # Merge narratives (prefer extracted, fallback to AI)
         narrative = DocumentExtractor.merge_with_ai_narrative(extracted_narrative, ai_narrative)
-        print(f"[Task] Project {project_id}: Merged extracted + AI narrative")
-        
-        # DEBUG: Show what narrative data looks like
-        print(f"[Task] DEBUG - Narrative slide_1 keys: {list(narrative.get('slide_1', {}).keys())}")
-        if narrative.get('slide_1', {}).get('biz_desc'):
-            print(f"[Task] DEBUG - biz_desc preview: {narrative['slide_1']['biz_desc'][:100]}...")
-        if narrative.get('slide_1', {}).get('certifications'):
-            print(f"[Task] DEBUG - certifications: {narrative['slide_1']['certifications']}")
-        if narrative.get('slide_1', {}).get('product_portfolio'):
-            print(f"[Task] DEBUG - products: {len(narrative['slide_1']['product_portfolio'])} items")
-        
-        # If no real data was found by parser, check extracted narrative financials
-        if not has_real_data:
-            if extracted_narrative.get("financials"):
-                financial_data = extracted_narrative["financials"]
-                print(f"[Task] Project {project_id}: Using PDF-extracted financials: {list(financial_data.keys())}")
-            elif narrative.get("financials"):
-                financial_data = narrative.get("financials")
-                print(f"[Task] Project {project_id}: Using AI-estimated financials")
-        
-        # Final fallback if both parser and AI failed (unlikely now)
-        if not financial_data.get("revenue") and not financial_data.get("years"):
-            financial_data = {
-                "years": ["FY21", "FY22", "FY23", "FY24"],
-                "revenue": [100, 125, 160, 200],
-                "ebitda": [15, 20, 28, 38],
-                "pat": [8, 12, 18, 25]
-            }
-            print(f"[Task] Project {project_id}: Using default financials (no source data)")
-        print(f"[Task] Project {project_id}: Narrative and financials ready")
-        
-        # ========== 6. FETCH IMAGES ==========
-        print(f"[Task] Project {project_id}: Fetching images...")
+        logger.info("[Task] Project %s: Merged extracted + AI narrative", project_id)
+
+        # DEBUG: Show what narrative data looks like (formatting skipped unless
+        # the level is actually enabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            slide_1 = narrative.get('slide_1') or {}
+            biz_desc = slide_1.get('biz_desc')
+            certs = slide_1.get('certifications')
+            products = slide_1.get('product_portfolio')
+            logger.debug("[Task] DEBUG - Narrative slide_1 keys: %s", list(slide_1.keys()))
+            if biz_desc:
+                logger.debug("[Task] DEBUG - biz_desc preview: %s...", biz_desc[:100])
+            if certs:
+                logger.debug("[Task] DEBUG - certifications: %s", certs)
+            if products:
+                logger.debug("[Task] DEBUG - products: %s items", len(products))
+
+        # Single pass over the fallback chain: the first source with actual
+        # series data wins (parser > PDF-extracted > AI-estimated > defaults).
+        # The parsed tier must have revenue - a years-only table from the PDF
+        # path shouldn't shadow extracted financials that do have revenue.
+        fin_sources = (
+            ("parsed", excel_data, False),
+            ("pdf_extracted", extracted_narrative.get("financials") or {}, True),
+            ("ai_estimated", narrative.get("financials") or {}, True),
+        )
+        fin_label, financial_data = next(
+            ((label, d) for label, d, years_ok in fin_sources
+             if d.get("revenue") or (years_ok and d.get("years"))),
+            ("defaults", dict(DEFAULT_FIN))
+        )
+        logger.info("[Task] Project %s: Financials source: %s", project_id, fin_label)
+        logger.info("[Task] Project %s: Narrative and financials ready", project_id)
+
+        # Collect the image fetches launched above
+        logger.info("[Task] Project %s: Fetching images...", project_id)
         image_paths = {}
         try:
-            for i in range(3):
-                img_url = ImageService.get_sector_image(sector, variation=i)
+            for i, img_future in enumerate(image_futures):
+                img_url = img_future.result()
                 if img_url:
                     image_paths[f"slide_{i+1}"] = img_url
-                    print(f"[Task] Project {project_id}: Got image {i+1}: {img_url[:50]}...")
+                    logger.info("[Task] Project %s: Got image %s: %s...", project_id, i + 1, img_url[:50])
         except Exception as e:
-            print(f"[Task] Project {project_id}: Image fetch error - {e}")
-        
-        # ========== 7. CREATE OUTPUT DIRECTORY ==========
+            logger.info("[Task] Project %s: Image fetch error - %s", project_id, e)
+
+        # Output directory. Path.mkdir goes straight to mkdirat instead of
+        # makedirs' per-level exists() stats - matters on NFS-backed data dirs
         temp_dir = f"data/projects/{project_id}"
-        os.makedirs(temp_dir, exist_ok=True)
-        
-        # ========== 8. GENERATE PPT ==========
-        print(f"[Task] Project {project_id}: Generating PPT...")
+        Path(temp_dir).mkdir(parents=True, exist_ok=True)
+
+        logger.info("[Task] Project %s: Generating PPT...", project_id)
         ppt_input = {
             "project_id": project_id,
             "company_name": company_name or "The Company",
@@ -180,111 +400,199 @@ def process_project_task(self=None, project_id: int = None):
             "generated_images": image_paths,
             "kpis": pdf_kpis
         }
-        
+
         output_filename = f"Investment_Teaser.pptx"
         output_path = os.path.join(temp_dir, output_filename)
-        
+
         generator = PPTGenerator(output_path, ppt_input)
         generator.generate()
-        print(f"[Task] Project {project_id}: PPT saved -> {output_path}")
-        
-        # ========== 9. GENERATE CITATIONS ==========
-        print(f"[Task] Project {project_id}: Generating Citations...")
+        logger.info("[Task] Project %s: PPT saved -> %s", project_id, output_path)
+
+        logger.info("[Task] Project %s: Generating Citations...", project_id)
         citation_filename = f"Citations.pdf"
         citation_path = os.path.join(temp_dir, citation_filename)
-        
-        sources = []
-        for f in project.files:
-            sources.append({"type": "file", "value": f.filename, "context": "Data Extraction"})
-        
+
         try:
             from app.services.citation_generator import get_citation_generator
             cit_gen = get_citation_generator(citation_path, project_id)
-            cit_gen.generate(sources, company_name=company_name or "The Company")
-            print(f"[Task] Project {project_id}: Citations saved")
+            cit_gen.generate(state.get("sources", []), company_name=company_name or "The Company")
+            logger.info("[Task] Project %s: Citations saved", project_id)
         except Exception as e:
-            print(f"[Task] Project {project_id}: Citation error - {e}")
-        
-        # ========== 10. UPLOAD TO S3 ==========
-        print(f"[Task] Project {project_id}: Uploading to S3...")
+            logger.info("[Task] Project %s: Citation error - %s", project_id, e)
+
+        state["financial_data"] = financial_data
+        state["output_filename"] = output_filename
+        state["output_path"] = output_path
+        state["citation_filename"] = citation_filename
+        state["citation_path"] = citation_path
+        # One stat covers both the upload and artifact checks downstream
+        state["citation_exists"] = os.path.exists(citation_path)
+        return state
+
+    finally:
+        pool.shutdown(wait=False)
+
+
+def _upload_stage(state: dict) -> dict:
+    """Stage 4: S3 uploads, artifact rows, final status"""
+    if state.get("aborted"):
+        return state
+    project_id = state["project_id"]
+    sector = state.get("sector")
+    financial_data = state.get("financial_data") or {}
+    output_path = state["output_path"]
+    citation_path = state["citation_path"]
+    citation_exists = state.get("citation_exists", False)
+    db = SessionLocal()
+    pool = ThreadPoolExecutor(max_workers=2)
+
+    try:
+        project = db.get(models.Project, project_id)
+        if not project:
+            logger.info("[Task] Project %s vanished before upload", project_id)
+            state["aborted"] = True
+            return state
+
+        logger.info("[Task] Project %s: Uploading to S3...", project_id)
         s3_key_ppt = output_path
         s3_key_cit = citation_path
         version_id_ppt = None
         version_id_cit = None
-        
+
         try:
             from app.services.s3_service import get_s3_service
             s3 = get_s3_service()
-            
-            s3_key_ppt = f"projects/{project_id}/{output_filename}"
-            version_id_ppt = s3.upload_file(output_path, s3_key_ppt)
-            
-            if os.path.exists(citation_path):
-                s3_key_cit = f"projects/{project_id}/{citation_filename}"
-                version_id_cit = s3.upload_file(citation_path, s3_key_cit)
-            
-            print(f"[Task] Project {project_id}: S3 upload complete")
+
+            # Both artifacts go up in parallel; each large file additionally
+            # multiparts via the service's TransferConfig
+            s3_key_ppt = f"projects/{project_id}/{state['output_filename']}"
+            ppt_future = pool.submit(s3.upload_file, output_path, s3_key_ppt)
+
+            cit_future = None
+            if citation_exists:
+                s3_key_cit = f"projects/{project_id}/{state['citation_filename']}"
+                cit_future = pool.submit(s3.upload_file, citation_path, s3_key_cit)
+
+            version_id_ppt = ppt_future.result()
+            if cit_future is not None:
+                version_id_cit = cit_future.result()
+
+            logger.info("[Task] Project %s: S3 upload complete", project_id)
         except Exception as e:
-            print(f"[Task] Project {project_id}: S3 error (using local) - {e}")
-        
-        # ========== 11. SAVE ARTIFACTS ==========
-        print(f"[Task] Project {project_id}: Saving artifacts...")
-        
-        # PPT Artifact
-        artifact_ppt = models.Artifact(
-            artifact_type="ppt",
-            file_path=output_path,
-            s3_key=s3_key_ppt,
-            version_id=version_id_ppt,
-            project_id=project.id
-        )
-        db.add(artifact_ppt)
-        
-        # Citation Artifact
-        if os.path.exists(citation_path):
-            artifact_cit = models.Artifact(
+            logger.info("[Task] Project %s: S3 error (using local) - %s", project_id, e)
+
+        logger.info("[Task] Project %s: Saving artifacts...", project_id)
+
+        # Batch both artifacts into the same flush as the status update below;
+        # one final commit covers everything
+        artifacts = [
+            models.Artifact(
+                artifact_type="ppt",
+                file_path=output_path,
+                s3_key=s3_key_ppt,
+                version_id=version_id_ppt,
+                project_id=project.id
+            )
+        ]
+        if citation_exists:
+            artifacts.append(models.Artifact(
                 artifact_type="citation_doc",
                 file_path=citation_path,
                 s3_key=s3_key_cit,
                 version_id=version_id_cit,
                 project_id=project.id
-            )
-            db.add(artifact_cit)
-        
-        # ========== 12. FINALIZE ==========
+            ))
+        db.add_all(artifacts)
+
         project.status = models.ProjectStatus.COMPLETED
         project.sector = sector
-        
-        # Store metrics
+
+        # Store metrics; bind the tail values once instead of re-indexing
         if financial_data:
             rev = financial_data.get("revenue", [])
             ebitda = financial_data.get("ebitda", [])
+            rev_last = rev[-1] if rev else 0
+            ebitda_last = ebitda[-1] if ebitda else 0
             project.metrics = {
-                "revenue": str(rev[-1]) if rev else "",
+                "revenue": str(rev_last) if rev else "",
                 "revenue_cagr": f"{IntelligenceService._calc_cagr(rev)}%" if rev else "",
-                "ebitda_margin": f"{round(ebitda[-1]/rev[-1]*100)}%" if ebitda and rev and rev[-1] > 0 else "",
+                "ebitda_margin": f"{round(ebitda_last/rev_last*100)}%" if ebitda and rev_last > 0 else "",
                 "sector": sector
             }
-        
+
         db.commit()
-        print(f"[Task] Project {project_id}: ========== COMPLETED ==========")
-        
+        logger.info("[Task] Project %s: ========== COMPLETED ==========", project_id)
+        return state
+
+    finally:
+        pool.shutdown(wait=False)
+        db.close()
+
+
+def _run_stage(stage_fn, state: dict) -> dict:
+    """Shared error handling for the chained stage tasks"""
+    _ensure_logging()
+    try:
+        return stage_fn(state)
+    except Exception:
+        project_id = state.get("project_id")
+        # logger.exception captures exc_info once and formats it on the
+        # listener thread, unlike traceback.print_exc's unbuffered stdout dump
+        logger.exception("[Task] Project %s: ========== FAILED (%s) ==========", project_id, stage_fn.__name__)
+        _mark_failed(project_id)
+        raise  # aborts the rest of the chain
+
+
+@celery_app.task(name="app.tasks.parse_project", acks_late=True)
+def parse_project(project_id: int):
+    return _run_stage(_parse_stage, {"project_id": project_id})
+
+
+@celery_app.task(name="app.tasks.enrich_project", acks_late=True)
+def enrich_project(state: dict):
+    return _run_stage(_enrich_stage, state)
+
+
+@celery_app.task(name="app.tasks.generate_assets", acks_late=True)
+def generate_assets(state: dict):
+    return _run_stage(_generate_stage, state)
+
+
+@celery_app.task(name="app.tasks.upload_artifacts", acks_late=True)
+def upload_artifacts(state: dict):
+    return _run_stage(_upload_stage, state)
+
+
+def process_project_pipeline(project_id: int):
+    """
+    Dispatch the staged pipeline through the broker. Each stage is routed to
+    its own queue (see celery_app task_routes) so worker pools can be sized
+    per stage and a slow LLM step never blocks the next project's parse.
+    """
+    return chain(
+        parse_project.s(project_id),
+        enrich_project.s(),
+        generate_assets.s(),
+        upload_artifacts.s(),
+    ).apply_async()
+
+
+@celery_app.task(name="app.tasks.process_project_task", bind=True, max_retries=2, acks_late=True)
+def process_project_task(self=None, project_id: int = None):
+    """
+    Single-process entry point: runs all four stages back to back. Used by
+    the direct/background-task path where no broker is configured.
+    """
+    _ensure_logging()
+    state = {"project_id": project_id, "_inline": True}
+    try:
+        for stage in (_parse_stage, _enrich_stage, _generate_stage, _upload_stage):
+            state = stage(state)
+
     except Exception as e:
-        print(f"[Task] Project {project_id}: ========== FAILED ==========")
-        print(f"[Task] Error: {e}")
-        traceback.print_exc()
-        
-        try:
-            project = db.query(models.Project).filter(models.Project.id == project_id).first()
-            if project:
-                project.status = models.ProjectStatus.FAILED
-                db.commit()
-        except:
-            pass
-        
+        logger.exception("[Task] Project %s: ========== FAILED ==========", project_id)
+        _mark_failed(project_id)
+
         # Retry if available
         if self and getattr(self, 'request', None) and self.request.retries < self.max_retries:
             raise self.retry(exc=e, countdown=10)
-    
-    finally:
-        db.close()
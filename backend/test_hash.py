@@ -1,8 +1,13 @@
-from passlib.context import CryptContext
+import os
 import sys
 
+# Reuse the app's CryptContext singleton instead of building a fresh one
+# (backend scan + 12-round bcrypt) per run; TESTING drops to 4 rounds
+os.environ.setdefault("TESTING", "1")
+
 try:
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    from app.core.security import pwd_context
+
     pass_hash = pwd_context.hash("testpassword")
     print(f"Hash success: {pass_hash}")
     verify = pwd_context.verify("testpassword", pass_hash)